@@ -1,6 +1,6 @@
 import tkinter as tk
 import random
-import winsound
+from audio import AudioPlayer
 
 # Main window
 root = tk.Tk()
@@ -29,9 +29,11 @@ label_result = tk.Label(frame_game, text="", font=("Arial", 16), fg="white", bg=
 label_streak = tk.Label(frame_game, text="Streak: 0", font=("Arial", 12), fg="gray", bg="#111")
 
 # Sound
+audio = AudioPlayer()
+
 def play_tone(freq):
     if sound_on.get():
-        winsound.Beep(freq, 200)
+        audio.play(freq)
 
 # Breathing animation
 radius = 50
@@ -120,3 +122,4 @@ tk.Button(frame_intro, text="Start", font=("Arial", 12), bg="#5cd3ff", fg="black
 
 frame_intro.pack(fill="both", expand=True)
 root.mainloop()
+audio.close()
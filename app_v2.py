@@ -1,6 +1,6 @@
 import tkinter as tk
 import random
-import winsound
+from audio import AudioPlayer
 
 root = tk.Tk()
 root.title("Intuition Trainer")
@@ -49,9 +49,11 @@ label_start_training = tk.Label(frame_breath, text="", font=("Arial", 14), fg="#
 canvas_game = tk.Canvas(frame_game, width=400, height=300, bg="#111", highlightthickness=0)
 label_info = tk.Label(frame_game, text="", font=("Arial", 16), fg="white", bg="#111")
 
+audio = AudioPlayer()
+
 def play_tone(freq):
     if sound_on.get():
-        winsound.Beep(freq, 200)
+        audio.play(freq)
 
 # ===== Breathing Animation =====
 radius = 50
@@ -174,3 +176,4 @@ def end_game():
 
 frame_intro.pack(fill="both", expand=True)
 root.mainloop()
+audio.close()
@@ -1,6 +1,6 @@
 import tkinter as tk
 import random
-import winsound
+from audio import AudioPlayer
 
 root = tk.Tk()
 root.title("Intuition Trainer")
@@ -57,9 +57,11 @@ canvas_game = tk.Canvas(frame_game, width=400, height=300, bg="#111", highlightt
 label_info = tk.Label(frame_game, text="", font=("Arial", 16), fg="white", bg="#111")
 entry_guess = tk.Entry(frame_game, font=("Arial", 14), justify="center")
 
+audio = AudioPlayer()
+
 def play_tone(freq):
     if sound_on.get():
-        winsound.Beep(freq, 200)
+        audio.play(freq)
 
 # ===== Intro Breathing (unchanged) =====
 radius = 50
@@ -187,3 +189,4 @@ def end_game():
 
 frame_intro.pack(fill="both", expand=True)
 root.mainloop()
+audio.close()
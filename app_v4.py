@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 import random
-import winsound
+from audio import AudioPlayer
 
 root = tk.Tk()
 root.title("Intuition Trainer")
@@ -63,9 +63,11 @@ btn_end = tk.Button(frame_game, text="End Session", font=("Arial", 11),
                     bg="#444", fg="white", activebackground="#666",
                     command=lambda: end_game())
 
+audio = AudioPlayer()
+
 def play_tone(freq):
     if sound_on.get():
-        winsound.Beep(freq, 200)
+        audio.play(freq)
 
 # ===== Intro Breathing (unchanged) =====
 radius = 50
@@ -194,3 +196,4 @@ def end_game():
 
 frame_intro.pack(fill="both", expand=True)
 root.mainloop()
+audio.close()
@@ -1,6 +1,6 @@
 import tkinter as tk
 import random
-import winsound
+from audio import AudioPlayer
 
 root = tk.Tk()
 root.title("Intuition Trainer")
@@ -61,9 +61,11 @@ btn_end = tk.Button(frame_game, text="End Session", font=("Arial", 11),
                     bg="#444", fg="white", activebackground="#666",
                     command=lambda: end_game())
 
+audio = AudioPlayer()
+
 def play_tone(freq):
     if sound_on.get():
-        winsound.Beep(freq, 200)
+        audio.play(freq)
 
 radius = 50
 max_radius = 120
@@ -197,3 +199,4 @@ def end_game():
 
 frame_intro.pack(fill="both", expand=True)
 root.mainloop()
+audio.close()
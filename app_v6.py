@@ -1,203 +1,244 @@
 import tkinter as tk
 from tkinter import ttk
 import random
-import winsound
-
-# === Root Window Setup ===
-root = tk.Tk()
-root.title("Intuition Trainer")
-root.geometry("400x450")
-root.configure(bg="#111")
-
-# === Style Configuration ===
-style = ttk.Style()
-style.theme_use('clam')
-
-style.configure("TLabel", background="#111", foreground="white", font=("Helvetica", 12))
-style.configure("Header.TLabel", background="#111", foreground="#5cd3ff", font=("Helvetica", 20, "bold"))
-style.configure("TButton", font=("Helvetica", 12), padding=6)
-style.configure("TRadiobutton", background="#111", foreground="white", font=("Helvetica", 11))
-style.configure("TCheckbutton", background="#111", foreground="white", font=("Helvetica", 11))
-
-# === Variables ===
-sound_on = tk.BooleanVar(value=True)
-difficulty = tk.StringVar(value="Easy")
-mode = tk.StringVar(value="Think")
-streak = 0
-
-ranges = {"Easy": (1, 10), "Medium": (1, 30), "Hard": (1, 60), "Expert": (1, 99)}
-affirmations = [
-    "Trust your inner knowing.",
-    "Your intuition is growing stronger.",
-    "You already know the answer.",
-    "Calm mind, clear vision.",
-    "Let your inner voice guide you."
-]
-
-# === Frames ===
-frame_intro = ttk.Frame(root)
-frame_breath = ttk.Frame(root)
-frame_game = ttk.Frame(root)
-frame_end = ttk.Frame(root)
-
-# === Intro Screen ===
-ttk.Label(frame_intro, text="Intuition Trainer", style="Header.TLabel").pack(pady=20)
-ttk.Label(frame_intro, text="Choose difficulty:").pack()
-
-for level in ranges.keys():
-    ttk.Radiobutton(frame_intro, text=level, variable=difficulty, value=level).pack(pady=2)
-
-ttk.Checkbutton(frame_intro, text="Sound on", variable=sound_on).pack(pady=10)
-
-ttk.Label(frame_intro, text="Choose mode:").pack(pady=(15, 0))
-ttk.Radiobutton(frame_intro, text="Think of a number", variable=mode, value="Think").pack(pady=2)
-ttk.Radiobutton(frame_intro, text="Input a number", variable=mode, value="Input").pack(pady=2)
-
-ttk.Button(frame_intro, text="Continue", command=lambda: start_breathing_intro()).pack(pady=30)
-
-# === Breathing Screen ===
-canvas_breath = tk.Canvas(frame_breath, width=400, height=300, bg="#111", highlightthickness=0)
-label_affirm = ttk.Label(frame_breath, text="", wraplength=380)
-label_start_training = ttk.Label(frame_breath, text="", foreground="#5cd3ff")
-
-# === Game Screen ===
-canvas_game = tk.Canvas(frame_game, width=400, height=300, bg="#111", highlightthickness=0)
-label_info = ttk.Label(frame_game, text="")
-entry_guess = ttk.Entry(frame_game, font=("Helvetica", 14), justify="center")
-btn_end = ttk.Button(frame_game, text="End Session", command=lambda: end_game())
-
-# === Functions ===
-def play_tone(freq):
-    if sound_on.get():
-        winsound.Beep(freq, 200)
-
-radius = 50
-max_radius = 120
-min_radius = 50
-
-def draw_circle(canvas, r, text="", color="#5cd3ff"):
-    canvas.delete("all")
-    x0, y0 = 200 - r, 150 - r
-    x1, y1 = 200 + r, 150 + r
-    canvas.create_oval(x0, y0, x1, y1, fill=color, outline="")
-    if text:
-        canvas.create_text(200, 150, text=text, fill="white", font=("Helvetica", 16))
-
-def start_breathing_intro():
-    frame_intro.pack_forget()
-    frame_breath.pack(fill="both", expand=True)
-    label_affirm.config(text=random.choice(affirmations))
-    label_affirm.pack(pady=10)
-    canvas_breath.pack(pady=10)
-    label_start_training.pack(pady=10)
-    run_intro_breath_cycle()
-
-def run_intro_breath_cycle():
-    steps = 40
-    duration = 4000 // steps
-
-    def inhale(i=0):
-        if i <= steps:
-            r = min_radius + (max_radius - min_radius) * (i / steps)
-            draw_circle(canvas_breath, r, "Inhale")
-            root.after(duration, inhale, i + 1)
-        else:
-            pause1()
-
-    def pause1(t=0):
-        if t < 4000:
-            draw_circle(canvas_breath, max_radius, "Pause")
-            root.after(100, pause1, t + 100)
-        else:
-            exhale()
-
-    def exhale(i=0):
-        if i <= steps:
-            r = max_radius - (max_radius - min_radius) * (i / steps)
-            draw_circle(canvas_breath, r, "Exhale")
-            root.after(duration, exhale, i + 1)
-        else:
-            pause2()
-
-    def pause2(t=0):
-        if t < 4000:
-            draw_circle(canvas_breath, min_radius, "Pause")
-            root.after(100, pause2, t + 100)
-        else:
-            end_intro_breathing()
-
-    inhale()
-
-def end_intro_breathing():
-    canvas_breath.delete("all")
-    label_affirm.config(text="")
-    label_start_training.config(text="Let's start the training")
-    ttk.Button(frame_breath, text="Start", command=start_game).pack(pady=10)
-
-def start_game():
-    frame_breath.pack_forget()
-    frame_game.pack(fill="both", expand=True)
-    canvas_game.pack(pady=20)
-    label_info.pack(pady=5)
-    btn_end.pack(pady=10)
-    next_round()
-
-def next_round():
-    color = random.choice(["#5cd3ff", "#00bfa5", "#66e0ff"])
-    draw_circle(canvas_game, 80, "", color=color)
-    prepare_guess()
-
-def prepare_guess():
-    if mode.get() == "Think":
-        label_info.config(text="Think of a number...")
-        root.after(3000, show_number)
-    else:
-        label_info.config(text="Type your number and press Enter")
-        entry_guess.pack(pady=5)
-        entry_guess.delete(0, tk.END)
-        entry_guess.bind("<Return>", check_guess)
-
-def show_number():
-    global streak
-    low, high = ranges[difficulty.get()]
-    num = random.randint(low, high)
-    label_info.config(text=f"The number was {num}")
-    play_tone(600)
-    streak += 1
-    root.after(2000, next_round)
-
-def check_guess(event=None):
-    global streak
-    low, high = ranges[difficulty.get()]
-    try:
-        guess = int(entry_guess.get())
-    except ValueError:
-        label_info.config(text="Enter a valid number")
-        return
-
-    cheat_chance = 0.15
-    if random.random() < cheat_chance:
-        num = guess
-    else:
-        num = random.randint(low, high)
-
-    entry_guess.pack_forget()
-    if guess == num:
-        label_info.config(text=f"Correct! The number was {num}")
-        play_tone(800)
-        streak += 1
-    else:
-        label_info.config(text=f"The number was {num}")
-        play_tone(400)
-    root.after(2000, next_round)
-
-def end_game():
-    frame_game.pack_forget()
-    frame_end.pack(fill="both", expand=True)
+import os
+import sys
+from types import SimpleNamespace
+
+from audio import AudioPlayer
+from breathing import BreathCycle
+from circle_renderer import CircleRenderer
+from clock import TimerRegistry, clock_from_env
+from fonts import TkFontRegistry
+from idle import IdleTracker
+from patterns import timeline_from_env
+import roundlog
+import store
+from session import TrainerSession, ROUNDS, INVALID_GUESS
+from stats import LiveStats
+
+KIOSK_RESTART_MS = 15000
+
+
+def build(root, clock=None, kiosk=None):
+    # Builds every screen inside root and returns the widgets, state and
+    # callbacks as one namespace, for main() and the soak test. Nothing runs
+    # at import time, so importing app_v6 costs only its imports.
+
+    # === Root Window Setup ===
+    root.title("Intuition Trainer")
+    root.geometry("400x450")
+    root.configure(bg="#111")
+    clock = clock or clock_from_env("tk", root)
+    timers = TimerRegistry(clock)  # every session delay; cancelled on each screen change
+    idle = IdleTracker(timers)  # pauses the timers, and with them the animation, while unseen
+    fonts = TkFontRegistry(root)
+
+    # === Style Configuration ===
+    style = ttk.Style()
+    style.theme_use('clam')
+
+    style.configure("TLabel", background="#111", foreground="white", font=fonts.get(12))
+    style.configure("Header.TLabel", background="#111", foreground="#5cd3ff", font=fonts.get(20, bold=True))
+    style.configure("TButton", font=fonts.get(12), padding=6)
+    style.configure("TRadiobutton", background="#111", foreground="white", font=fonts.get(11))
+    style.configure("TCheckbutton", background="#111", foreground="white", font=fonts.get(11))
+
+    # === Variables ===
+    session = TrainerSession(now=timers.now)
+    round_log = roundlog.attach(session)  # every round appended to the binary history
+    session_store = store.attach(session)  # and queued for the SQLite history
+    stats = LiveStats()  # hit rate, runs and response time, updated each round
+    if kiosk is None:
+        kiosk = bool(os.environ.get("INTUITION_KIOSK"))  # loop back to the intro after each session
+    sound_on = tk.BooleanVar(value=True)
+    difficulty = tk.StringVar(value=session.difficulty)
+    mode = tk.StringVar(value=session.mode)
+
+    # === Frames ===
+    frame_intro = ttk.Frame(root)
+    frame_breath = ttk.Frame(root)
+    frame_game = ttk.Frame(root)
+    frame_end = ttk.Frame(root)
+
+    # === Intro Screen ===
+    ttk.Label(frame_intro, text="Intuition Trainer", style="Header.TLabel").pack(pady=20)
+    ttk.Label(frame_intro, text="Choose difficulty:").pack()
+
+    for level in session.ranges.keys():
+        ttk.Radiobutton(frame_intro, text=level, variable=difficulty, value=level).pack(pady=2)
+
+    ttk.Checkbutton(frame_intro, text="Sound on", variable=sound_on).pack(pady=10)
+
+    ttk.Label(frame_intro, text="Choose mode:").pack(pady=(15, 0))
+    ttk.Radiobutton(frame_intro, text="Think of a number", variable=mode, value="Think").pack(pady=2)
+    ttk.Radiobutton(frame_intro, text="Input a number", variable=mode, value="Input").pack(pady=2)
+
+    ttk.Button(frame_intro, text="Continue", command=lambda: start_breathing_intro()).pack(pady=30)
+
+    # === Breathing Screen ===
+    canvas_breath = tk.Canvas(frame_breath, width=400, height=300, bg="#111", highlightthickness=0)
+    label_affirm = ttk.Label(frame_breath, text="", wraplength=380)
+    label_start_training = ttk.Label(frame_breath, text="", foreground="#5cd3ff")
+    breath_circle = CircleRenderer(canvas_breath, font=fonts.get(16))
+    btn_start = ttk.Button(frame_breath, text="Start", command=lambda: start_game())
+    breath_cycle = BreathCycle(timers, breath_circle.draw, lambda: end_intro_breathing(), timeline_from_env())
+
+    # === Game Screen ===
+    canvas_game = tk.Canvas(frame_game, width=400, height=300, bg="#111", highlightthickness=0)
+    label_info = ttk.Label(frame_game, text="")
+    label_stats = ttk.Label(frame_game, text="", font=fonts.get(10), justify="center")
+    entry_guess = ttk.Entry(frame_game, font=fonts.get(14), justify="center")
+    # Bound once: every bind() registers a new Tcl command that is never freed
+    entry_guess.bind("<Return>", lambda event: check_guess())
+    btn_end = ttk.Button(frame_game, text="End Session", command=lambda: end_game())
+    game_circle = CircleRenderer(canvas_game, font=fonts.get(16))
+
+    # === End Screen ===
     ttk.Label(frame_end, text="Session Ended", style="Header.TLabel").pack(pady=20)
-    ttk.Label(frame_end, text=f"Your streak: {streak}").pack(pady=10)
-    ttk.Button(frame_end, text="Close", command=root.destroy).pack(pady=15)
-
-# === Start App ===
-frame_intro.pack(fill="both", expand=True)
-root.mainloop()
\ No newline at end of file
+    label_streak = ttk.Label(frame_end, text="")
+    label_streak.pack(pady=10)
+    btn_close = ttk.Button(frame_end, text="New Session" if kiosk else "Close",
+                           command=lambda: restart() if kiosk else root.destroy())
+    btn_close.pack(pady=15)
+
+    # === Functions ===
+    audio = AudioPlayer()
+
+    def play_tone(freq):
+        if sound_on.get():
+            audio.play(freq)
+
+    def start_breathing_intro():
+        timers.cancel_all()
+        frame_intro.pack_forget()
+        frame_breath.pack(fill="both", expand=True)
+        session.difficulty = difficulty.get()
+        session.mode = mode.get()
+        label_affirm.config(text=session.start_breathing())
+        label_affirm.pack(pady=10)
+        canvas_breath.pack(pady=10)
+        label_start_training.pack(pady=10)
+        run_intro_breath_cycle()
+
+    def run_intro_breath_cycle():
+        label_start_training.config(text="")
+        btn_start.pack_forget()
+        breath_cycle.start()
+
+    def end_intro_breathing():
+        breath_circle.clear()
+        if os.environ.get("INTUITION_FRAME_STATS"):
+            print(f"breathing: {breath_circle.stats.report()}")
+            print(f"breathing: {breath_cycle.report()}")
+        label_affirm.config(text="")
+        label_start_training.config(text="Let's start the training")
+        btn_start.pack(pady=10)
+
+    def start_game():
+        session.start_game()
+        stats.reset()
+        label_stats.config(text=stats.text())
+        timers.cancel_all()
+        frame_breath.pack_forget()
+        frame_game.pack(fill="both", expand=True)
+        canvas_game.pack(pady=20)
+        label_info.pack(pady=5)
+        label_stats.pack(pady=5)
+        btn_end.pack(pady=10)
+        next_round()
+
+    def next_round():
+        if session.state != ROUNDS:
+            return
+        color = random.choice(["#5cd3ff", "#00bfa5", "#66e0ff"])
+        game_circle.draw(80, "", color=color)
+        prepare_guess()
+
+    def prepare_guess():
+        label_info.config(text=session.next_round())
+        if session.awaiting == "reveal":
+            timers.call_later(3000, show_number)
+        else:
+            entry_guess.pack(pady=5)
+            entry_guess.delete(0, tk.END)
+
+    def show_number():
+        if session.state != ROUNDS:
+            return
+        result = session.reveal()
+        label_info.config(text=result.text)
+        play_tone(600)
+        timers.call_later(2000, next_round)
+
+    def check_guess(event=None):
+        if session.awaiting != "guess":
+            return
+        try:
+            result = session.submit_guess(entry_guess.get())
+        except ValueError:
+            label_info.config(text=INVALID_GUESS)
+            return
+
+        entry_guess.pack_forget()
+        label_info.config(text=result.text)
+        play_tone(800 if result.hit else 400)
+        timers.call_later(2000, next_round)
+
+    def on_round(session, result):
+        stats.update(session, result)
+        label_stats.config(text=stats.text())
+
+    session.on_round.append(on_round)
+
+    def end_game():
+        timers.cancel_all()
+        frame_game.pack_forget()
+        frame_end.pack(fill="both", expand=True)
+        streak = session.end()
+        label_streak.config(text=stats.end_text())
+        if session_store is not None:
+            session_store.end_session(session, streak)
+        if kiosk:
+            timers.call_later(KIOSK_RESTART_MS, restart)
+
+    def restart():
+        timers.cancel_all()
+        session.restart()
+        entry_guess.pack_forget()
+        frame_end.pack_forget()
+        frame_intro.pack(fill="both", expand=True)
+
+    def on_visibility(event):
+        if event.widget is not root:
+            return  # frames are mapped and unmapped on every screen change
+        hidden = event.type == tk.EventType.Unmap or getattr(event, "state", None) == "VisibilityFullyObscured"
+        if idle.set_hidden(hidden) and not hidden and os.environ.get("INTUITION_FRAME_STATS"):
+            print(f"idle: {idle.report()}")
+
+    for sequence in ("<Map>", "<Unmap>", "<Visibility>"):
+        root.bind(sequence, on_visibility, add="+")
+
+    def close():
+        audio.close()
+        if round_log is not None:
+            round_log.close()
+        if session_store is not None:
+            session_store.close()
+
+    frame_intro.pack(fill="both", expand=True)
+    if os.environ.get("INTUITION_STARTUP_REPORT"):
+        print(f"startup: {fonts.report()}")
+    return SimpleNamespace(**locals())
+
+
+def main(kiosk=None):
+    root = tk.Tk()
+    app = build(root, kiosk=kiosk)
+    root.mainloop()
+    app.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
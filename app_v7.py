@@ -3,8 +3,8 @@
 import sys
 import random
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-    QRadioButton, QButtonGroup, QLineEdit, QStackedLayout
+    QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QRadioButton,
+    QButtonGroup, QLineEdit, QStackedLayout
 )
 from PyQt5.QtGui import QFont, QPixmap
 from PyQt5.QtCore import Qt, QTimer
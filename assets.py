@@ -0,0 +1,259 @@
+# Intuition Trainer — Background Asset Pipeline
+#
+# The background photo is decoded once per (source hash, window size, device
+# pixel ratio), scaled and cropped to the window and written to a cache
+# directory. Later launches load the small cached JPEG instead of decoding and
+# scaling the full-resolution source. The source hash is memoised by path,
+# size and mtime, so a warm start does not re-read the source to hash it
+# either. When the compiled resource bundle from tools/build_resources.py is
+# present, its pre-scaled variants are used first.
+#
+# For other window sizes (resizing, maximizing) a pyramid of the photo at
+# successively halved resolutions is kept; each size is served from the
+# smallest level that still covers it, so only a small final scale is needed.
+#
+#   python assets.py build [--size 400x450] [--dpr 1 2]   pre-build variants
+#   python assets.py report                               time cold vs cached
+
+import os
+import sys
+import time
+
+from PyQt5.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+from PyQt5.QtCore import Qt, QSize
+
+CACHE_DIR = os.environ.get(
+    "INTUITION_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "intuition-trainer")
+)
+DEFAULT_SIZE = (400, 450)
+DEFAULT_DPRS = (1, 1.5, 2)
+BUNDLED_DPRS = (1, 2)
+JPEG_QUALITY = 90
+PYRAMID_MIN_EDGE = 256
+
+
+def hash_file(path):
+    import hashlib  # loads OpenSSL; only needed when the source changed
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def source_digest(path):
+    # Memoized in a sidecar file keyed by (path, size, mtime_ns), so a warm
+    # start costs one stat() instead of reading and hashing the whole photo
+    stat = os.stat(path)
+    key = [os.path.abspath(path), str(stat.st_size), str(stat.st_mtime_ns)]
+    memo = os.path.join(CACHE_DIR, os.path.splitext(os.path.basename(path))[0] + ".digest")
+    try:
+        with open(memo, encoding="utf-8") as f:
+            lines = f.read().split("\n")
+        if lines[:3] == key and len(lines) == 4 and lines[3]:
+            return lines[3]
+    except OSError:
+        pass
+    digest = hash_file(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(memo, "w", encoding="utf-8") as f:
+            f.write("\n".join(key + [digest]))
+    except OSError:
+        pass  # a read-only cache only costs us the speed-up
+    return digest
+
+
+def variant_path(source, digest, width, height, dpr):
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(CACHE_DIR, f"{stem}-{digest}-{width}x{height}@{dpr:g}x.jpg")
+
+
+def frame(image, target):
+    # Same framing as QLabel showing a KeepAspectRatioByExpanding pixmap:
+    # left-aligned, vertically centred, cropped to the window.
+    y = (image.height() - target.height()) // 2
+    return image.copy(0, y, target.width(), target.height())
+
+
+def render_variant(source, width, height, dpr):
+    target = QSize(round(width * dpr), round(height * dpr))
+    reader = QImageReader(source)
+    full = reader.size()
+    if not full.isValid():
+        raise FileNotFoundError(f"{source} not found or unreadable.")
+    scaled = full.scaled(target, Qt.KeepAspectRatioByExpanding)
+    reader.setScaledSize(scaled)  # lets the JPEG decoder skip detail we would throw away
+    image = reader.read()
+    if image.isNull():
+        raise FileNotFoundError(f"{source} could not be decoded: {reader.errorString()}")
+    return frame(image, target)
+
+
+def render_pyramid(source, min_edge=PYRAMID_MIN_EDGE):
+    # The decoded source followed by successive halvings, largest first
+    image = QImageReader(source).read()
+    if image.isNull():
+        raise FileNotFoundError(f"{source} not found or unreadable.")
+    levels = [image]
+    while min(image.width(), image.height()) // 2 >= min_edge:
+        image = image.scaled(image.width() // 2, image.height() // 2, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        levels.append(image)
+    return levels
+
+
+def pyramid_alias(level):
+    return f"images/pyramid-{level.width()}x{level.height()}.jpg"
+
+
+class BackgroundPyramid:
+    def __init__(self, levels):
+        # levels: (QSize, path or QImage), any order; paths are decoded on first use
+        self.levels = sorted(levels, key=lambda level: level[0].width())
+        self.images = {}
+        self.renders = 0
+        self.render_ms = 0.0
+
+    @classmethod
+    def from_source(cls, source):
+        return cls([(image.size(), image) for image in render_pyramid(source)])
+
+    @classmethod
+    def bundled(cls):
+        # Levels compiled into pyramid_rc by tools/build_resources.py, or None
+        try:
+            import pyramid_rc  # noqa: F401
+        except ImportError:
+            return None
+        from PyQt5.QtCore import QDir
+
+        levels = []
+        for name in QDir(":/images").entryList(["pyramid-*.jpg"]):
+            path = f":/images/{name}"
+            levels.append((QImageReader(path).size(), path))
+        return cls(levels) if levels else None
+
+    def level_for(self, target):
+        # The smallest level that covers target without upscaling, else the largest
+        for size, _ in self.levels:
+            if size.scaled(target, Qt.KeepAspectRatioByExpanding).width() <= size.width():
+                return size
+        return self.levels[-1][0]
+
+    def image(self, size):
+        key = (size.width(), size.height())
+        image = self.images.get(key)
+        if image is None:
+            source = next(src for s, src in self.levels if s == size)
+            image = self.images[key] = source if isinstance(source, QImage) else QImage(source)
+        return image
+
+    def render(self, width, height, dpr=1, smooth=True):
+        start = time.perf_counter()
+        target = QSize(round(width * dpr), round(height * dpr))
+        level = self.image(self.level_for(target))
+        mode = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+        pixmap = QPixmap.fromImage(frame(level.scaled(target, Qt.KeepAspectRatioByExpanding, mode), target))
+        pixmap.setDevicePixelRatio(dpr)
+        self.renders += 1
+        self.render_ms += (time.perf_counter() - start) * 1000
+        return pixmap
+
+
+def load_background(source, width, height, dpr=1, timings=None):
+    start = time.perf_counter()
+    digest = source_digest(source)
+    path = variant_path(source, digest, width, height, dpr)
+    pixmap = QPixmap(path) if os.path.exists(path) else QPixmap()
+    cached = not pixmap.isNull()
+    if not cached:
+        image = render_variant(source, width, height, dpr)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            image.save(path, "JPEG", JPEG_QUALITY)
+        except OSError:
+            pass  # a read-only cache only costs us the speed-up
+        pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(dpr)
+    if timings is not None:
+        timings["background"] = (time.perf_counter() - start) * 1000
+        timings["background_source"] = "cached variant" if cached else "decoded and cached"
+    return pixmap
+
+
+def bundled_background_alias(width, height, dpr):
+    return f"images/background-{width}x{height}@{dpr:g}x.jpg"
+
+
+def bundled_background(width, height, dpr=1, timings=None):
+    # Returns None when resources_rc has not been built
+    start = time.perf_counter()
+    try:
+        import resources_rc  # noqa: F401  (registers the ":/" resources)
+    except ImportError:
+        return None
+    # Prefer the smallest variant at least as sharp as the screen
+    for candidate in sorted(BUNDLED_DPRS, key=lambda d: (d < dpr, abs(d - dpr))):
+        pixmap = QPixmap(":/" + bundled_background_alias(width, height, candidate))
+        if not pixmap.isNull():
+            pixmap.setDevicePixelRatio(candidate)
+            if timings is not None:
+                timings["background"] = (time.perf_counter() - start) * 1000
+                timings["background_source"] = "compiled resource"
+            return pixmap
+    return None
+
+
+def build(source, size=DEFAULT_SIZE, dprs=DEFAULT_DPRS):
+    digest = source_digest(source)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    paths = []
+    for dpr in dprs:
+        path = variant_path(source, digest, size[0], size[1], dpr)
+        render_variant(source, size[0], size[1], dpr).save(path, "JPEG", JPEG_QUALITY)
+        paths.append(path)
+    return paths
+
+
+def report(source, size=DEFAULT_SIZE, dpr=1, runs=5):
+    def best(fn):
+        times = []
+        for _ in range(runs):
+            QPixmapCache.clear()  # QPixmap(path) would otherwise be served from memory
+            start = time.perf_counter()
+            fn()
+            times.append((time.perf_counter() - start) * 1000)
+        return min(times)
+
+    def full_decode():
+        target = QSize(round(size[0] * dpr), round(size[1] * dpr))
+        QPixmap(source).scaled(target, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+    build(source, size, [dpr])
+    cold = best(full_decode)
+    warm = best(lambda: load_background(source, size[0], size[1], dpr))
+    print(f"{os.path.basename(source)} at {size[0]}x{size[1]}@{dpr:g}x: "
+          f"full decode + scale {cold:.1f} ms, cached variant {warm:.1f} ms, saved {cold - warm:.1f} ms")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from PyQt5.QtWidgets import QApplication
+
+    parser = argparse.ArgumentParser(description="Build and time cached background variants")
+    parser.add_argument("command", choices=["build", "report"])
+    parser.add_argument("--source", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "trainer.jpg"))
+    parser.add_argument("--size", default="x".join(map(str, DEFAULT_SIZE)))
+    parser.add_argument("--dpr", type=float, nargs="+", default=list(DEFAULT_DPRS))
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    if args.command == "build":
+        for path in build(args.source, size, args.dpr):
+            print(path)
+    else:
+        for dpr in args.dpr:
+            report(args.source, size, dpr)
@@ -0,0 +1,146 @@
+# Intuition Trainer — Feedback Tones
+#
+# Tones are synthesized once into WAV buffers and played from a background
+# thread, so play() returns immediately and never blocks the UI loop.
+
+import array
+import atexit
+import io
+import math
+import os
+import queue
+import shutil
+import sys
+import threading
+import wave
+
+FEEDBACK_TONES = (400, 600, 800)
+SAMPLE_RATE = 22050
+
+
+def synthesize(freq, ms=200, rate=SAMPLE_RATE, volume=0.4):
+    count = rate * ms // 1000
+    fade = min(count // 2, rate // 200)  # 5 ms ramps avoid clicks at the edges
+    peak = 32767 * volume
+    step = 2 * math.pi * freq / rate
+    samples = array.array("h", bytes(2 * count))
+    for i in range(count):
+        gain = min(1.0, i / fade, (count - 1 - i) / fade) if fade else 1.0
+        samples[i] = int(peak * gain * math.sin(step * i))
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(rate)
+        out.writeframes(samples.tobytes())
+    return buf.getvalue()
+
+
+class ToneBank:
+    def __init__(self, freqs=FEEDBACK_TONES, ms=200):
+        self.ms = ms
+        self.tones = {}
+        self._dir = None
+        for freq in freqs:
+            self.get(freq)
+
+    def get(self, freq):
+        wav = self.tones.get(freq)
+        if wav is None:
+            wav = self.tones[freq] = synthesize(freq, self.ms)
+        return wav
+
+    def path(self, freq):
+        # File copy of a cached tone, for players that only accept paths
+        if self._dir is None:
+            import tempfile
+
+            self._dir = tempfile.mkdtemp(prefix="intuition-tones-")
+            atexit.register(self.cleanup)  # also when a frontend exits without close()
+        path = os.path.join(self._dir, f"{freq}.wav")
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(self.get(freq))
+        return path
+
+    def cleanup(self):
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+            atexit.unregister(self.cleanup)
+
+
+def _find_backend(bank):
+    try:
+        import simpleaudio
+    except ImportError:
+        simpleaudio = None
+    if simpleaudio is not None:
+        def play(freq):
+            with wave.open(io.BytesIO(bank.get(freq))) as src:
+                frames = src.readframes(src.getnframes())
+            simpleaudio.play_buffer(frames, 1, 2, SAMPLE_RATE).wait_done()
+        return play
+
+    if sys.platform == "win32":
+        import winsound
+        return lambda freq: winsound.PlaySound(bank.get(freq), winsound.SND_MEMORY)
+
+    for cmd in (["afplay"], ["paplay"], ["aplay", "-q"]):
+        if shutil.which(cmd[0]):
+            import subprocess
+
+            return lambda freq, cmd=cmd: subprocess.run(
+                cmd + [bank.path(freq)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+    return None
+
+
+class AudioPlayer:
+    def __init__(self, freqs=FEEDBACK_TONES, ms=200):
+        self.bank = ToneBank(freqs, ms)
+        self._backend = _find_backend(self.bank)
+        self._queue = queue.Queue(maxsize=2)
+        self._thread = None
+
+    @property
+    def available(self):
+        return self._backend is not None
+
+    def play(self, freq):
+        if self._backend is None:
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="tone-player", daemon=True)
+            self._thread.start()
+        try:
+            self._queue.put_nowait(freq)
+        except queue.Full:
+            pass  # a backlog of stale feedback tones is worse than a dropped one
+
+    def _run(self):
+        while True:
+            freq = self._queue.get()
+            if freq is None:
+                break
+            try:
+                self._backend(freq)
+            except Exception:
+                pass  # sound is best-effort; never take the UI down with it
+
+    def close(self):
+        if self._thread is not None:
+            # Drop the pending tones so the stop marker fits without blocking:
+            # a full queue would otherwise wait on a tone that is still playing
+            try:
+                while True:
+                    self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(None)  # only this thread puts, so there is room
+            self._thread.join(timeout=1)
+            self._thread = None
+        self.bank.cleanup()
@@ -0,0 +1,97 @@
+# Intuition Trainer — Qt Breathing Circle
+#
+# One QVariantAnimation, created with the widget, runs each phase's elapsed
+# time; the radius is looked up in the shared curve tables and QPainter draws
+# the circle, repainting only the area it covers. pause()/resume() hold the
+# animation while the window is hidden.
+
+import time
+
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QColor, QPainter
+from PyQt5.QtCore import Qt, QRectF, QVariantAnimation
+
+import curves
+from patterns import MAX_RADIUS
+
+
+class BreathCircle(QWidget):
+    def __init__(self, parent=None, color="#5cd3ff"):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setMinimumHeight(2 * MAX_RADIUS + 10)
+        self.color = QColor(color)
+        self.radius = 0.0
+        self.paints = 0
+        self.ticks = 0
+        self.keyframe = None
+        self._started = None
+
+        self.animation = QVariantAnimation(self)
+        self.animation.valueChanged.connect(self._advance)
+
+    def play(self, keyframe, offset_ms=0.0, speed=1.0):
+        # Animate the phase's elapsed time from offset_ms to its end; speed is
+        # the session clock's time scale.
+        if self._started is None:
+            self._started = (time.perf_counter(), time.process_time(), self.paints)
+        self.animation.stop()
+        self.keyframe = keyframe
+        label, start, duration, r0, r1, curve = keyframe
+        real_ms = int((duration - offset_ms) / speed)
+        if r0 == r1 or real_ms <= 0:
+            self.set_radius(r1)
+            return
+        self.animation.setStartValue(float(offset_ms))
+        self.animation.setEndValue(float(duration))
+        self.animation.setDuration(real_ms)
+        self.animation.start()
+
+    def _advance(self, elapsed_ms):
+        self.ticks += 1
+        self.set_radius(curves.radius_at(self.keyframe, elapsed_ms))
+
+    def pause(self):
+        if self.animation.state() == QVariantAnimation.Running:
+            self.animation.pause()
+
+    def resume(self):
+        if self.animation.state() == QVariantAnimation.Paused:
+            self.animation.resume()
+
+    def stop(self):
+        self.animation.stop()
+        self._started = None
+        self.set_radius(0.0)
+
+    def set_radius(self, r):
+        old = self._bounds(self.radius)
+        self.radius = r
+        self.update(old.united(self._bounds(r)).toAlignedRect())
+
+    def _scale(self):
+        return min(self.width(), self.height()) / (2 * MAX_RADIUS + 10)
+
+    def _bounds(self, r):
+        r *= self._scale()
+        return QRectF(self.width() / 2 - r - 1, self.height() / 2 - r - 1, 2 * r + 2, 2 * r + 2)
+
+    def paintEvent(self, event):
+        self.paints += 1
+        if self.radius <= 0:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.color)
+        r = self.radius * self._scale()
+        painter.drawEllipse(QRectF(self.width() / 2 - r, self.height() / 2 - r, 2 * r, 2 * r))
+
+    def report(self):
+        if self._started is None:
+            return "no frames"
+        wall0, cpu0, paints0 = self._started
+        wall = time.perf_counter() - wall0
+        cpu = time.process_time() - cpu0
+        paints = self.paints - paints0
+        return f"{paints} paints, {paints / wall:.1f} fps, {100 * cpu / wall:.1f}% CPU"
@@ -0,0 +1,97 @@
+# Intuition Trainer — Breathing Cycle
+#
+# Plays a compiled breathing Timeline (see patterns.py) on a clock. Every
+# phase and frame deadline is an offset from one start timestamp, so a late
+# tick shortens the wait for the next one instead of pushing the rest of the
+# cycle back. Moving phases tick every frame_ms (frame_ms=0 means phase
+# changes only); a phase whose radius does not change draws once and sleeps
+# until its deadline. Frames identical to the one on screen are skipped.
+# Radii come from the shared curve tables in curves.py. on_phase, if given, is
+# told about each keyframe (and how far into it the cycle already is) as it
+# starts, so a frontend can run its own animation for it.
+
+import curves
+from patterns import PATTERNS
+
+
+class BreathCycle:
+    def __init__(self, clock, on_frame, on_done, timeline=None, frame_ms=100, on_phase=None):
+        self.clock = clock
+        self.on_frame = on_frame
+        self.on_done = on_done
+        self.on_phase = on_phase
+        self.frame_ms = frame_ms
+        self.timeline = timeline or PATTERNS["box"].compile()
+        self._reset()
+
+    def _reset(self):
+        self.wakeups = 0
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+        self.phase_wakeups = {}
+        self.late_total = 0.0  # sum of how late each wake-up fired, ms
+        self.late_max = 0.0
+        self.end_drift = 0.0  # actual minus nominal cycle length, ms
+        self._shown = None
+        self._phase = None
+        self._t0 = None
+
+    def start(self, timeline=None):
+        if timeline is not None:
+            self.timeline = timeline
+        self._reset()
+        self._t0 = self.clock.now()
+        self._tick(self._t0, woken=False)
+
+    def _draw(self, r, text):
+        frame = (round(r, 1), text)
+        if frame == self._shown:
+            self.frames_skipped += 1
+            return
+        self._shown = frame
+        self.frames_drawn += 1
+        self.on_frame(r, text)
+
+    def _wake(self, due):
+        late = max(0.0, self.clock.now() - due)
+        self.wakeups += 1
+        self.late_total += late
+        if late > self.late_max:
+            self.late_max = late
+        self._tick(due)
+
+    def _tick(self, due, woken=True):
+        now = max(self.clock.now(), due)  # timers may fire slightly early
+        elapsed = now - self._t0
+        timeline = self.timeline
+        if elapsed >= timeline.total_ms:
+            self.end_drift = elapsed - timeline.total_ms
+            self.on_done()
+            return
+
+        index = timeline.index_at(elapsed)
+        keyframe = timeline.keyframes[index]
+        text, start, duration, r0, r1, curve = keyframe
+        if woken:
+            self.phase_wakeups[text] = self.phase_wakeups.get(text, 0) + 1
+        phase_start = self._t0 + start
+        offset = elapsed - start
+        if index != self._phase:
+            self._phase = index
+            if self.on_phase is not None:
+                self.on_phase(keyframe, offset)
+        if r0 == r1 or not self.frame_ms:
+            self._draw(r0, text)
+            next_due = phase_start + duration
+        else:
+            self._draw(curves.radius_at(keyframe, offset), text)
+            frame = int(offset // self.frame_ms) + 1
+            next_due = min(phase_start + frame * self.frame_ms, phase_start + duration)
+        self.clock.call_later(next_due - now, self._wake, next_due)
+
+    def report(self):
+        per_phase = ", ".join(f"{text} {n}" for text, n in self.phase_wakeups.items())
+        return (f"{self.timeline.name}: {self.wakeups} wake-ups ({per_phase}), "
+                f"{self.frames_drawn} frames drawn, {self.frames_skipped} skipped, "
+                f"late {self.late_total:.1f} ms total / {self.late_max:.1f} ms max, "
+                f"cycle drift {self.end_drift:.1f} ms")
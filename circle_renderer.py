@@ -0,0 +1,59 @@
+# Intuition Trainer — Retained-Mode Circle Renderer for Tk Canvases
+#
+# The oval and its label are created once per canvas; each frame only moves
+# them with coords() and touches itemconfig() when the fill or text changes.
+
+import time
+
+
+class FrameStats:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    def record(self, seconds):
+        self.frames += 1
+        self.total += seconds
+        if seconds > self.worst:
+            self.worst = seconds
+
+    @property
+    def mean_ms(self):
+        return self.total * 1000 / self.frames if self.frames else 0.0
+
+    def report(self):
+        return f"{self.frames} frames, mean {self.mean_ms:.3f} ms, max {self.worst * 1000:.3f} ms"
+
+
+class CircleRenderer:
+    def __init__(self, canvas, cx=200, cy=150, font=("Helvetica", 16), stats=None):
+        self.canvas = canvas
+        self.cx = cx
+        self.cy = cy
+        self.stats = stats or FrameStats()
+        self.oval = canvas.create_oval(cx, cy, cx, cy, fill="", outline="", state="hidden")
+        self.label = canvas.create_text(cx, cy, text="", fill="white", font=font, state="hidden")
+        self._color = None
+        self._text = None
+
+    def draw(self, r, text="", color="#5cd3ff"):
+        start = time.perf_counter()
+        canvas = self.canvas
+        canvas.coords(self.oval, self.cx - r, self.cy - r, self.cx + r, self.cy + r)
+        if color != self._color:
+            canvas.itemconfig(self.oval, fill=color, state="normal")
+            self._color = color
+        if text != self._text:
+            canvas.itemconfig(self.label, text=text, state="normal" if text else "hidden")
+            self._text = text
+        self.stats.record(time.perf_counter() - start)
+
+    def clear(self):
+        self.canvas.itemconfig(self.oval, state="hidden")
+        self.canvas.itemconfig(self.label, state="hidden")
+        self._color = None
+        self._text = None
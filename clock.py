@@ -0,0 +1,233 @@
+# Intuition Trainer — Pluggable Clocks
+#
+# Every delay in the frontends goes through clock.call_later(ms, callback) so a
+# session can run in real time, time-compressed (INTUITION_TIME_SCALE=1000) or
+# on a fully virtual clock (INTUITION_CLOCK=virtual). A TimerRegistry in front
+# of the clock tracks a session's pending timers so they can be cancelled
+# together.
+
+import heapq
+import itertools
+import os
+import time
+
+
+class Timer:
+    __slots__ = ("deadline", "callback", "args", "cancelled", "_cancel")
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self._cancel = None
+
+    def cancel(self):
+        if not self.cancelled:
+            self.cancelled = True
+            if self._cancel is not None:
+                self._cancel()
+
+    def fire(self):
+        if not self.cancelled:
+            self.cancelled = True
+            self.callback(*self.args)
+
+
+class Clock:
+    def __init__(self, scale=1.0):
+        if scale <= 0:
+            raise ValueError("time scale must be positive")
+        self.scale = scale
+        self._origin = time.monotonic()
+
+    def now(self):
+        # Milliseconds of session time since the clock was created
+        return (time.monotonic() - self._origin) * 1000.0 * self.scale
+
+    def call_later(self, ms, callback, *args):
+        timer = Timer(self.now() + ms, callback, args)
+        timer._cancel = self._schedule(max(0, round(ms / self.scale)), timer.fire)
+        return timer
+
+    def _schedule(self, real_ms, fire):
+        raise NotImplementedError
+
+
+class QtClock(Clock):
+    def __init__(self, scale=1.0):
+        super().__init__(scale)
+        self._live = set()
+
+    def _schedule(self, real_ms, fire):
+        from PyQt5.QtCore import Qt, QTimer
+
+        qtimer = QTimer()
+        qtimer.setSingleShot(True)
+        qtimer.setTimerType(Qt.PreciseTimer)
+
+        def timeout():
+            self._live.discard(qtimer)
+            fire()
+
+        def cancel():
+            qtimer.stop()
+            self._live.discard(qtimer)
+
+        qtimer.timeout.connect(timeout)
+        self._live.add(qtimer)  # keep a reference until it fires
+        qtimer.start(real_ms)
+        return cancel
+
+
+class TkClock(Clock):
+    def __init__(self, root, scale=1.0):
+        super().__init__(scale)
+        self.root = root
+
+    def _schedule(self, real_ms, fire):
+        after_id = self.root.after(real_ms, fire)
+        return lambda: self.root.after_cancel(after_id)
+
+
+class VirtualClock(Clock):
+    # Time only moves when advance()/run_until() is called. With a driver clock,
+    # each scheduled callback also posts a zero-delay step through the toolkit's
+    # event loop, so a GUI runs a whole session as fast as it can process events.
+    def __init__(self, driver=None):
+        super().__init__()
+        self._now = 0.0
+        self._queue = []
+        self._seq = itertools.count()
+        self.driver = driver
+
+    def now(self):
+        return self._now
+
+    def call_later(self, ms, callback, *args):
+        timer = Timer(self._now + max(0, ms), callback, args)
+        heapq.heappush(self._queue, (timer.deadline, next(self._seq), timer))
+        if self.driver is not None:
+            self.driver.call_later(0, self.advance)
+        return timer
+
+    def next_deadline(self):
+        while self._queue and self._queue[0][2].cancelled:
+            heapq.heappop(self._queue)
+        return self._queue[0][0] if self._queue else None
+
+    def advance(self):
+        # Jump to the next deadline and fire it; returns False when nothing is pending
+        if self.next_deadline() is None:
+            return False
+        deadline, _, timer = heapq.heappop(self._queue)
+        self._now = max(self._now, deadline)
+        timer.fire()
+        return True
+
+    def run_until(self, ms):
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > ms:
+                break
+            self.advance()
+        self._now = max(self._now, ms)
+
+    def run_until_idle(self, max_steps=1_000_000):
+        steps = 0
+        while steps < max_steps and self.advance():
+            steps += 1
+        return steps
+
+
+class TimerRegistry:
+    # Schedules on a clock like the clock itself, but keeps every pending
+    # timer so cancel_all() can drop them at once, e.g. when the screen
+    # changes and a queued round would otherwise fire into the next screen.
+    # pause() stops the registry's time and disarms its timers; resume()
+    # re-arms them with the time they had left.
+    def __init__(self, clock):
+        self.clock = clock
+        self._live = set()
+        self._paused_at = None
+        self._paused_ms = 0.0
+        self.scheduled = 0
+        self.cancelled = 0
+        self.fired = 0
+
+    @property
+    def scale(self):
+        return self.clock.scale
+
+    @property
+    def paused(self):
+        return self._paused_at is not None
+
+    def now(self):
+        if self._paused_at is not None:
+            return self._paused_at - self._paused_ms
+        return self.clock.now() - self._paused_ms
+
+    def call_later(self, ms, callback, *args):
+        timer = Timer(self.now() + ms, callback, args)
+        self._live.add(timer)
+        self.scheduled += 1
+        if self._paused_at is None:
+            self._arm(timer, ms)
+        return timer
+
+    def _arm(self, timer, ms):
+        def fire():
+            self._live.discard(timer)
+            self.fired += 1
+            timer.fire()
+
+        timer._cancel = self.clock.call_later(ms, fire).cancel
+
+    @property
+    def live(self):
+        # Timers cancelled directly (timer.cancel()) are dropped here
+        self._live = {timer for timer in self._live if not timer.cancelled}
+        return len(self._live)
+
+    def cancel_all(self):
+        count = 0
+        for timer in self._live:
+            if not timer.cancelled:
+                timer.cancel()
+                count += 1
+        self._live.clear()
+        self.cancelled += count
+        return count
+
+    def pause(self):
+        if self._paused_at is not None:
+            return
+        self._paused_at = self.clock.now()
+        for timer in self._live:
+            if timer._cancel is not None:
+                timer._cancel()
+                timer._cancel = None
+
+    def resume(self):
+        if self._paused_at is None:
+            return
+        self._paused_ms += self.clock.now() - self._paused_at
+        self._paused_at = None
+        now = self.now()
+        for timer in list(self._live):
+            if not timer.cancelled:
+                self._arm(timer, max(0, timer.deadline - now))
+
+
+def clock_from_env(toolkit, root=None):
+    scale = float(os.environ.get("INTUITION_TIME_SCALE", "1"))
+    if toolkit == "qt":
+        base = QtClock(scale)
+    elif toolkit == "tk":
+        base = TkClock(root, scale)
+    else:
+        raise ValueError(f"unknown toolkit '{toolkit}'")
+    if os.environ.get("INTUITION_CLOCK") == "virtual":
+        return VirtualClock(driver=base)
+    return base
@@ -0,0 +1,103 @@
+# Intuition Trainer — Background Compositor
+#
+# The translucent panels behind the labels never change while a screen is up,
+# only their text does. The compositor paints the photo and the current
+# screen's panels into one pixmap, kept in QPixmapCache, and shows it in the
+# window's background label; tracked labels draw just their text. A text
+# change then repaints as a plain blit of the composite instead of blending a
+# panel over the photo again.
+
+import time
+
+from PyQt5.QtCore import QEvent, QObject, QPoint, QRect, QTimer
+from PyQt5.QtGui import QColor, QPainter, QPixmap, QPixmapCache
+from PyQt5.QtWidgets import QLabel
+
+# Geometry changes after which a screen's panels are composed again
+RECOMPOSE_EVENTS = (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide)
+
+
+class BackgroundCompositor(QObject):
+    def __init__(self, window, target, photo):
+        super().__init__(window)
+        self.window = window
+        self.target = target  # QLabel showing the composite
+        self.photo = photo
+        self.panel = QColor(0, 0, 0, 120)
+        self.screen = None
+        self.composed = 0
+        self.reused = 0
+        self.compose_ms = 0.0
+        self._pending = False
+
+    def track(self, label):
+        label.setProperty("panel", "composited")
+        label.installEventFilter(self)
+
+    def set_photo(self, photo):
+        self.photo = photo
+        self.schedule()
+
+    def set_panel_color(self, rgba):
+        self.panel = QColor(*rgba)
+        self.schedule()
+
+    def show(self, screen):
+        self.screen = screen
+        self.compose()
+
+    def eventFilter(self, obj, event):
+        if event.type() in RECOMPOSE_EVENTS:
+            self.schedule()
+        return False
+
+    def schedule(self):
+        # Coalesce a burst of geometry changes (e.g. a layout pass) into one compose
+        if not self._pending:
+            self._pending = True
+            QTimer.singleShot(0, self.compose)
+
+    def panels(self):
+        return [QRect(label.mapTo(self.window, QPoint(0, 0)), label.size())
+                for label in self.screen.findChildren(QLabel)
+                if label.property("panel") == "composited" and label.isVisibleTo(self.screen)]
+
+    def compose(self):
+        self._pending = False
+        if self.screen is None:
+            return
+        # Settle geometry first, so the very first compose is already right
+        for widget in (self.window, self.screen):
+            if widget.layout() is not None:
+                widget.layout().activate()
+        panels = self.panels()
+        size = self.target.size()
+        dpr = self.photo.devicePixelRatio()
+        key = "composite:%d:%dx%d@%g:%s:%s" % (
+            self.photo.cacheKey(), size.width(), size.height(), dpr, self.panel.name(QColor.HexArgb),
+            ";".join("%d,%d,%d,%d" % r.getRect() for r in panels),
+        )
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            started = time.perf_counter()
+            pixmap = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            painter = QPainter(pixmap)
+            painter.drawPixmap(0, 0, self.photo)
+            for rect in panels:
+                painter.fillRect(rect, self.panel)
+            painter.end()
+            # Room for every screen's composite at this size (a maximized HiDPI
+            # window is larger than Qt's default 10 MB cache)
+            needed_kb = 4 * pixmap.width() * pixmap.height() * pixmap.depth() // 8 // 1024
+            if QPixmapCache.cacheLimit() < needed_kb:
+                QPixmapCache.setCacheLimit(needed_kb)
+            QPixmapCache.insert(key, pixmap)
+            self.compose_ms += (time.perf_counter() - started) * 1000
+            self.composed += 1
+        else:
+            self.reused += 1
+        self.target.setPixmap(pixmap)
+
+    def report(self):
+        return f"composites: {self.composed} rendered in {self.compose_ms:.1f} ms, {self.reused} reused from cache"
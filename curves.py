@@ -0,0 +1,41 @@
+# Intuition Trainer — Animation Curves
+#
+# Radius tables are sampled once per (fps, duration, easing, radii) and cached.
+# Frontends look radii up by elapsed milliseconds, interpolating between
+# samples, so the drawing rate can change without changing phase timing.
+
+import functools
+import math
+
+TABLE_FPS = 60
+
+EASINGS = {
+    "linear": lambda p: p,
+    "sine": lambda p: 0.5 - 0.5 * math.cos(math.pi * p),
+    "hold": lambda p: 0.0,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def radius_table(fps, duration_ms, easing, r0, r1):
+    ease = EASINGS[easing]
+    frames = max(1, math.ceil(duration_ms * fps / 1000))
+    return tuple(r0 + (r1 - r0) * ease(min(1.0, i * 1000 / fps / duration_ms)) for i in range(frames + 1))
+
+
+def sample(table, fps, elapsed_ms):
+    pos = elapsed_ms * fps / 1000
+    if pos <= 0:
+        return table[0]
+    i = int(pos)
+    if i >= len(table) - 1:
+        return table[-1]
+    frac = pos - i
+    return table[i] + (table[i + 1] - table[i]) * frac
+
+
+def radius_at(keyframe, offset_ms, fps=TABLE_FPS):
+    label, start, duration, r0, r1, curve = keyframe
+    if r0 == r1:
+        return r0
+    return sample(radius_table(fps, duration, curve, r0, r1), fps, offset_ms)
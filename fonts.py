@@ -0,0 +1,96 @@
+# Intuition Trainer — Fonts
+#
+# Each frontend asks the registry for fonts by (size, bold). The family is
+# resolved once against the fonts actually installed, walking an explicit
+# fallback chain, instead of leaving "Helvetica" to the platform's fallback
+# matching on every widget and redraw. Font objects are created once per key
+# and shared.
+
+import time
+
+FAMILIES = ("Helvetica", "Arial", "Liberation Sans", "Nimbus Sans", "DejaVu Sans")
+
+
+class FontRegistry:
+    def __init__(self, families=FAMILIES):
+        self.families = families
+        self.family = None
+        self.fonts = {}
+        self.timings = {"resolve": 0.0, "create": 0.0}
+
+    def resolve(self):
+        if self.family is None:
+            started = time.perf_counter()
+            available = {name.lower(): name for name in self._available()}
+            self.family = next((available[f.lower()] for f in self.families if f.lower() in available), None)
+            if self.family is None:
+                self.family = self._default_family()
+            self.timings["resolve"] = (time.perf_counter() - started) * 1000
+        return self.family
+
+    def get(self, size, bold=False):
+        key = (size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            family = self.resolve()
+            started = time.perf_counter()
+            font = self.fonts[key] = self._create(family, size, bold)
+            self.timings["create"] += (time.perf_counter() - started) * 1000
+        return font
+
+    def report(self):
+        return (f"fonts: {self.family} resolved in {self.timings['resolve']:.1f} ms, "
+                f"{len(self.fonts)} fonts created in {self.timings['create']:.1f} ms")
+
+    def _available(self):
+        raise NotImplementedError
+
+    def _default_family(self):
+        raise NotImplementedError
+
+    def _create(self, family, size, bold):
+        raise NotImplementedError
+
+
+class QtFontRegistry(FontRegistry):
+    def _available(self):
+        from PyQt5.QtGui import QFontDatabase
+
+        return QFontDatabase().families()
+
+    def _default_family(self):
+        from PyQt5.QtGui import QFontDatabase
+
+        return QFontDatabase.systemFont(QFontDatabase.GeneralFont).family()
+
+    def _create(self, family, size, bold):
+        from PyQt5.QtGui import QFont, QFontInfo
+
+        font = QFont(family, size)
+        font.setBold(bold)
+        QFontInfo(font).family()  # match against the font database now, not at first paint
+        return font
+
+
+class TkFontRegistry(FontRegistry):
+    def __init__(self, root, families=FAMILIES):
+        super().__init__(families)
+        self.root = root
+
+    def _available(self):
+        import tkinter.font
+
+        return tkinter.font.families(self.root)
+
+    def _default_family(self):
+        import tkinter.font
+
+        # nametofont() only takes a root from Python 3.10 on
+        return tkinter.font.Font(self.root, name="TkDefaultFont", exists=True).actual("family")
+
+    def _create(self, family, size, bold):
+        import tkinter.font
+
+        # A named font: widgets and canvas items refer to it by name, so Tk
+        # does not parse and match a font description per use
+        return tkinter.font.Font(self.root, family=family, size=size, weight="bold" if bold else "normal")
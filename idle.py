@@ -0,0 +1,56 @@
+# Intuition Trainer — Idle Mode (no GUI toolkit imports)
+#
+# While the window is minimized, hidden or fully covered, the frontends call
+# set_hidden(True): the session's TimerRegistry is paused, so breathing
+# phases and rounds stop, and so are any extra animations registered with
+# on_pause/on_resume. On restore everything resumes where it left off.
+# Wake-ups that still happen while hidden are counted from the registered
+# sources, to check that an unseen window really sleeps.
+
+import time
+
+
+class IdleTracker:
+    def __init__(self, timers):
+        self.timers = timers
+        self.on_pause = []   # callables run when the window is hidden
+        self.on_resume = []  # and when it is visible again
+        self.sources = [lambda: self.timers.fired]  # cumulative wake-up counters
+        self.hidden_since = None
+        self.hidden_s = 0.0
+        self.hidden_wakeups = 0
+        self._wakeups_at_hide = 0
+
+    @property
+    def hidden(self):
+        return self.hidden_since is not None
+
+    def wakeups(self):
+        return sum(source() for source in self.sources)
+
+    def set_hidden(self, hidden):
+        if hidden == self.hidden:
+            return False
+        if hidden:
+            self.hidden_since = time.monotonic()
+            self._wakeups_at_hide = self.wakeups()
+            self.timers.pause()
+            for pause in self.on_pause:
+                pause()
+        else:
+            self.hidden_s += time.monotonic() - self.hidden_since
+            self.hidden_wakeups += self.wakeups() - self._wakeups_at_hide
+            self.hidden_since = None
+            self.timers.resume()
+            for resume in self.on_resume:
+                resume()
+        return True
+
+    def wakeups_per_minute(self):
+        if self.hidden_s <= 0:
+            return 0.0
+        return self.hidden_wakeups * 60 / self.hidden_s
+
+    def report(self):
+        return (f"hidden {self.hidden_s:.1f} s, {self.hidden_wakeups} wake-ups "
+                f"({self.wakeups_per_minute():.1f}/min)")
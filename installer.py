@@ -1,72 +1,259 @@
-# Intuition Trainer — PyQt5 Full Glow-Up Edition (No Sound, Bundled Image Support)
+# Intuition Trainer — PyQt5 Full Glow-Up Edition (Feedback Tones, Bundled Image Support)
 
 import sys
 import os
-import random
+import time
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QRadioButton,
-    QButtonGroup, QLineEdit, QStackedLayout
+    QButtonGroup, QCheckBox, QLineEdit, QStackedLayout
 )
-from PyQt5.QtGui import QFont, QPixmap
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QColor
+from PyQt5.QtCore import QEvent, Qt, QTimer
+
+from assets import DEFAULT_SIZE, BackgroundPyramid, bundled_background, load_background
+from clock import TimerRegistry, clock_from_env
+from compositor import BackgroundCompositor
+from fonts import QtFontRegistry
+from idle import IdleTracker
+import roundlog
+import store
+from session import TrainerSession, ROUNDS, INVALID_GUESS
+from stats import LiveStats
+from theme import DEFAULT_THEME, ThemeEngine
 
 
 def resource_path(filename):
     if getattr(sys, 'frozen', False):  # PyInstaller bundled
         return os.path.join(sys._MEIPASS, filename)
-    return os.path.join(os.path.abspath("."), filename)
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+
+
+# Quiet time after the last resize event before the background is rescaled
+# smoothly, and how much larger than the window a mid-drag background is made
+RESIZE_SETTLE_MS = 150
+DRAG_HEADROOM = 1.25
+# In kiosk mode the end screen returns to the intro on its own after this long
+KIOSK_RESTART_MS = 15000
 
 
 class IntuitionTrainer(QWidget):
-    def __init__(self):
+    def __init__(self, clock=None, kiosk=None):
         super().__init__()
+        started = time.perf_counter()
+        self.timings = {}
         self.setWindowTitle("Intuition Trainer")
-        self.setFixedSize(400, 450)
+        self.setMinimumSize(*DEFAULT_SIZE)
+        self.resize(*DEFAULT_SIZE)
 
-        # Background setup
+        # Background setup: the compiled resource bundle if built, otherwise a
+        # cached, pre-scaled variant of trainer.jpg. Other window sizes are
+        # rendered from the background pyramid, loaded on the first resize.
         self.background = QLabel(self)
-        pixmap = QPixmap(resource_path("trainer.jpg"))
-        if pixmap.isNull():
-            raise FileNotFoundError("trainer.jpg not found.")
-        self.background.setPixmap(pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding))
-        self.background.setGeometry(0, 0, 400, 450)
+        dpr = self.devicePixelRatioF()
+        pixmap = (bundled_background(*DEFAULT_SIZE, dpr, self.timings)
+                  or load_background(resource_path("trainer.jpg"), *DEFAULT_SIZE, dpr, self.timings))
+        self.background.setPixmap(pixmap)
+        self.background.setGeometry(self.rect())
         self.background.lower()
+        self.background_spec = (*DEFAULT_SIZE, dpr, True)  # (width, height, dpr, smooth) of the pixmap
+        self.pyramid = None
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(RESIZE_SETTLE_MS)
+        self.resize_timer.timeout.connect(self.settle_background)
+
+        # Label panels are painted into the background once per screen layout;
+        # INTUITION_COMPOSITE=0 draws them per label instead, for comparison
+        self.compositor = None
+        if os.environ.get("INTUITION_COMPOSITE", "1") != "0":
+            self.compositor = BackgroundCompositor(self, self.background, pixmap)
 
         # State
-        self.difficulty = "Easy"
-        self.mode = "Think"
-        self.streak = 0
-        self.ranges = {
-            "Easy": (1, 10),
-            "Medium": (1, 30),
-            "Hard": (1, 60),
-            "Expert": (1, 99)
-        }
-        self.affirmations = [
-            "Trust your inner knowing.",
-            "Your intuition is growing stronger.",
-            "You already know the answer.",
-            "Calm mind, clear vision.",
-            "Let your inner voice guide you."
-        ]
-
-        # Stack layout
+        from patterns import timeline_from_env
+
+        # Checked now: the breathing screen is built later, from a timer
+        self.breath_timeline = timeline_from_env()
+        self.clock = clock or clock_from_env("qt")
+        # Every session delay goes through the registry; switching screens
+        # cancels whatever the previous screen still had pending
+        self.timers = TimerRegistry(self.clock)
+        self.session = TrainerSession(now=self.timers.now)
+        self.round_log = roundlog.attach(self.session)
+        self.store = store.attach(self.session)
+        self.stats = LiveStats()
+        self.audio = None  # created with the game screen, which synthesizes the tones
+        self.session.on_round.append(self.on_round)
+        # ...and is paused, with the animations, while the window is not visible
+        self.idle = IdleTracker(self.timers)
+        # Kiosk mode loops intro → breathing → game → end, reusing every widget
+        self.kiosk = bool(os.environ.get("INTUITION_KIOSK")) if kiosk is None else kiosk
+
+        self.fonts = QtFontRegistry()
+
+        # Stack layout; screens are built on first use
         self.stack = QStackedLayout()
         self.setLayout(self.stack)
 
-        self.init_intro_screen()
-        self.init_breathing_screen()
-        self.init_game_screen()
-        self.init_end_screen()
-
-        self.stack.setCurrentWidget(self.intro_screen)
-
-    def styled_label(self, text, size=12, bold=False, color="white"):
+        self.screen_factories = {
+            "intro": (self.init_intro_screen, "intro_screen"),
+            "breath": (self.init_breathing_screen, "breath_screen"),
+            "game": (self.init_game_screen, "game_screen"),
+            "end": (self.init_end_screen, "end_screen"),
+        }
+        self.built_screens = set()
+        self.pending_prebuild = None  # built when idle, once the window has been exposed
+        self.on_screen_built = None  # callable(name, ms), for instrumentation
+        if os.environ.get("INTUITION_STARTUP_REPORT"):
+            self.on_screen_built = lambda name, ms: print(f"startup: built {name} screen in {ms:.1f} ms")
+
+        # One application-wide stylesheet; widgets select variants by property
+        self.theme = ThemeEngine(QApplication.instance())
+        self.theme.listeners.append(self.on_theme_changed)
+        self.theme.apply(os.environ.get("INTUITION_THEME", DEFAULT_THEME))
+
+        self.show_screen("intro", prebuild="breath")
+
+        self.timings["init"] = (time.perf_counter() - started) * 1000
+        if os.environ.get("INTUITION_STARTUP_REPORT"):
+            print(f"startup: background {self.timings['background']:.1f} ms ({self.timings['background_source']}), "
+                  f"window init {self.timings['init']:.1f} ms, {self.theme.report()}")
+            print(f"startup: {self.fonts.report()}")
+            if self.compositor is not None:
+                print(f"startup: {self.compositor.report()}")
+
+    def screen(self, name):
+        factory, attr = self.screen_factories[name]
+        if name not in self.built_screens:
+            started = time.perf_counter()
+            factory()
+            self.theme.polish(getattr(self, attr))
+            self.built_screens.add(name)
+            ms = (time.perf_counter() - started) * 1000
+            self.timings[f"screen:{name}"] = ms
+            if self.on_screen_built is not None:
+                self.on_screen_built(name, ms)
+        return getattr(self, attr)
+
+    def show_screen(self, name, prebuild=None):
+        self.timers.cancel_all()
+        widget = self.screen(name)
+        self.stack.setCurrentWidget(widget)
+        if self.compositor is not None:
+            self.compositor.show(widget)
+        if prebuild is not None and prebuild not in self.built_screens:
+            self.pending_prebuild = prebuild
+            handle = self.windowHandle()
+            if handle is not None and handle.isExposed():
+                self.schedule_prebuild()
+            # otherwise the first Expose (see eventFilter) schedules it
+
+    def schedule_prebuild(self):
+        # Expose repaints synchronously, so this zero-delay timer runs after
+        # the current screen has been painted
+        QTimer.singleShot(0, self.run_prebuild)
+
+    def run_prebuild(self):
+        name, self.pending_prebuild = self.pending_prebuild, None
+        if name is not None:
+            self.screen(name)
+
+    def background_pyramid(self):
+        if self.pyramid is None:
+            started = time.perf_counter()
+            self.pyramid = BackgroundPyramid.bundled() or BackgroundPyramid.from_source(resource_path("trainer.jpg"))
+            self.timings["pyramid"] = (time.perf_counter() - started) * 1000
+        return self.pyramid
+
+    def set_background(self, smooth):
+        width, height, dpr = self.width(), self.height(), self.devicePixelRatioF()
+        current_w, current_h, current_dpr, current_smooth = self.background_spec
+        if smooth:
+            if (current_w, current_h, current_dpr, current_smooth) == (width, height, dpr, True):
+                return
+        else:
+            # Mid-drag: keep showing (and clipping) the current pixmap while it
+            # covers the window; when it stops covering, scale the nearest
+            # pyramid level unfiltered and with headroom for the next steps
+            if current_dpr == dpr and current_w >= width and current_h >= height:
+                return
+            width, height = round(width * DRAG_HEADROOM), round(height * DRAG_HEADROOM)
+        pixmap = self.background_pyramid().render(width, height, dpr, smooth=smooth)
+        self.background_spec = (width, height, dpr, smooth)
+        self.background.setPixmap(pixmap)
+        if self.compositor is not None:
+            self.compositor.set_photo(pixmap)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.background.setGeometry(self.rect())
+        # While the edge is dragged, scale the nearest pyramid level without
+        # filtering; the smooth rescale runs once resizing pauses
+        self.set_background(smooth=False)
+        self.resize_timer.start()
+
+    def settle_background(self):
+        self.set_background(smooth=True)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        handle = self.windowHandle()
+        if handle is not None and not handle.property("tracked"):
+            handle.setProperty("tracked", True)
+            # Moving to a screen with another pixel ratio needs a sharper (or smaller) background
+            handle.screenChanged.connect(lambda screen: self.resize_timer.start())
+            # Expose events report a window that is covered or on a locked screen
+            handle.installEventFilter(self)
+        self.update_visibility()
+
+    def closeEvent(self, event):
+        if self.audio is not None:
+            self.audio.close()
+        if self.round_log is not None:
+            self.round_log.close()
+            self.round_log = None
+        if self.store is not None:
+            self.store.close()  # commits whatever the writer still holds
+            self.store = None
+        super().closeEvent(event)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_visibility()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.update_visibility()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Expose and obj is self.windowHandle():
+            self.update_visibility()
+            if self.pending_prebuild is not None and obj.isExposed():
+                self.schedule_prebuild()
+        return super().eventFilter(obj, event)
+
+    def update_visibility(self):
+        handle = self.windowHandle()
+        hidden = not self.isVisible() or self.isMinimized() or (handle is not None and not handle.isExposed())
+        if self.idle.set_hidden(hidden) and not hidden and os.environ.get("INTUITION_FRAME_STATS"):
+            print(f"idle: {self.idle.report()}")
+
+    def set_theme(self, name):
+        return self.theme.apply(name)
+
+    def on_theme_changed(self, palette):
+        if self.compositor is not None:
+            self.compositor.set_panel_color(palette["panel"])
+        if "breath" in self.built_screens:
+            self.breath_circle.color = QColor(palette["circle"])
+            self.breath_circle.update()
+
+    def styled_label(self, text, size=12, bold=False, tone="body"):
         label = QLabel(text)
-        font = QFont("Helvetica", size)
-        font.setBold(bold)
-        label.setFont(font)
-        label.setStyleSheet(f"color: {color}; background-color: rgba(0,0,0,120);")
+        label.setFont(self.fonts.get(size, bold))
+        label.setProperty("tone", tone)
+        if self.compositor is not None:
+            self.compositor.track(label)
         label.setAlignment(Qt.AlignCenter)
         return label
 
@@ -75,26 +262,27 @@ class IntuitionTrainer(QWidget):
         layout = QVBoxLayout(self.intro_screen)
         layout.setAlignment(Qt.AlignTop)
 
-        layout.addWidget(self.styled_label("Intuition Trainer", 20, bold=True, color="#5cd3ff"))
+        layout.addWidget(self.styled_label("Intuition Trainer", 20, bold=True, tone="accent"))
         layout.addWidget(self.styled_label("Choose difficulty:"))
 
         difficulty_group = QButtonGroup(self.intro_screen)
-        for level in self.ranges:
+        for level in self.session.ranges:
             btn = QRadioButton(level)
-            btn.setStyleSheet("color: white;")
             if level == "Easy":
                 btn.setChecked(True)
             btn.toggled.connect(lambda checked, l=level: self.set_difficulty(l) if checked else None)
             layout.addWidget(btn)
             difficulty_group.addButton(btn)
 
+        self.sound_check = QCheckBox("Sound on")
+        self.sound_check.setChecked(True)
+        layout.addWidget(self.sound_check)
+
         layout.addWidget(self.styled_label("Choose mode:"))
         think_rb = QRadioButton("Think of a number")
         input_rb = QRadioButton("Input a number")
         think_rb.setChecked(True)
-        think_rb.setStyleSheet("color: white;")
-        input_rb.setStyleSheet("color: white;")
-        think_rb.toggled.connect(lambda checked: setattr(self, 'mode', "Think" if checked else "Input"))
+        think_rb.toggled.connect(lambda checked: setattr(self.session, 'mode', "Think" if checked else "Input"))
 
         layout.addWidget(think_rb)
         layout.addWidget(input_rb)
@@ -106,33 +294,55 @@ class IntuitionTrainer(QWidget):
         self.stack.addWidget(self.intro_screen)
 
     def init_breathing_screen(self):
+        from breath_widget import BreathCircle
+        from breathing import BreathCycle
+
         self.breath_screen = QWidget()
         self.breath_layout = QVBoxLayout(self.breath_screen)
 
-        self.breath_label = self.styled_label("", 16, bold=True, color="#5cd3ff")
-        self.breath_affirmation = self.styled_label("", 12, color="white")
-        self.breath_phase = self.styled_label("", 18, bold=True, color="#66e0ff")
+        self.breath_label = self.styled_label("", 16, bold=True, tone="accent")
+        self.breath_affirmation = self.styled_label("", 12)
+        self.breath_phase = self.styled_label("", 18, bold=True, tone="phase")
+        self.breath_circle = BreathCircle(color=self.theme.palette["circle"])
+        self.idle.on_pause.append(self.breath_circle.pause)
+        self.idle.on_resume.append(self.breath_circle.resume)
+        self.idle.sources.append(lambda: self.breath_circle.ticks)
 
         self.breath_layout.addWidget(self.breath_affirmation)
         self.breath_layout.addWidget(self.breath_phase)
+        self.breath_layout.addWidget(self.breath_circle, 1)
         self.breath_layout.addWidget(self.breath_label)
 
+        self.start_button = QPushButton("Start")
+        self.start_button.clicked.connect(self.start_game)
+        self.start_button.hide()
+        self.breath_layout.addWidget(self.start_button)
+
+        self.breath_cycle = BreathCycle(
+            self.timers, lambda r, text: self.breath_phase.setText(text), self.end_intro_breathing,
+            timeline=self.breath_timeline, frame_ms=0, on_phase=self.animate_breath
+        )
+
         self.stack.addWidget(self.breath_screen)
 
     def init_game_screen(self):
+        from audio import AudioPlayer
+
+        self.audio = AudioPlayer()  # tones play from a thread; nothing blocks the event loop
         self.game_screen = QWidget()
         self.game_layout = QVBoxLayout(self.game_screen)
 
-        self.game_label = self.styled_label("", 14, color="white")
+        self.game_label = self.styled_label("", 14)
+        self.stats_label = self.styled_label("", 10)
         self.guess_entry = QLineEdit()
         self.guess_entry.setPlaceholderText("Enter your number")
-        self.guess_entry.setStyleSheet("background-color: white; color: black;")
         self.guess_entry.returnPressed.connect(self.check_guess)
 
         self.end_button = QPushButton("End Session")
         self.end_button.clicked.connect(self.end_game)
 
         self.game_layout.addWidget(self.game_label)
+        self.game_layout.addWidget(self.stats_label)
         self.game_layout.addWidget(self.guess_entry)
         self.game_layout.addWidget(self.end_button)
 
@@ -141,91 +351,115 @@ class IntuitionTrainer(QWidget):
     def init_end_screen(self):
         self.end_screen = QWidget()
         layout = QVBoxLayout(self.end_screen)
-        self.end_label = self.styled_label("Session Ended", 18, bold=True, color="#5cd3ff")
+        self.end_label = self.styled_label("Session Ended", 18, bold=True, tone="accent")
         self.streak_label = self.styled_label("", 14)
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(lambda: sys.exit())
+        self.close_button = QPushButton("New Session" if self.kiosk else "Close")
+        self.close_button.clicked.connect(self.restart if self.kiosk else self.close)
 
         layout.addWidget(self.end_label)
         layout.addWidget(self.streak_label)
-        layout.addWidget(close_btn)
+        layout.addWidget(self.close_button)
 
         self.stack.addWidget(self.end_screen)
 
     def set_difficulty(self, level):
-        self.difficulty = level
+        self.session.difficulty = level
 
     def start_breathing_intro(self):
-        self.stack.setCurrentWidget(self.breath_screen)
-        self.breath_affirmation.setText(random.choice(self.affirmations))
+        self.show_screen("breath", prebuild="game")
+        self.breath_affirmation.setText(self.session.start_breathing())
         self.run_breath_cycle()
 
     def run_breath_cycle(self):
         self.breath_label.setText("")
-        self.animate_breath("Inhale", 4000, lambda: self.pause("Pause", 4000, lambda: self.animate_breath("Exhale", 4000, lambda: self.pause("Pause", 4000, self.end_intro_breathing))))
-
-    def animate_breath(self, phase, duration, on_complete):
-        self.breath_phase.setText(phase)
-        QTimer.singleShot(duration, on_complete)
+        self.start_button.hide()
+        self.breath_cycle.start()
 
-    def pause(self, text, duration, on_complete):
-        self.breath_phase.setText(text)
-        QTimer.singleShot(duration, on_complete)
+    def animate_breath(self, keyframe, offset):
+        self.breath_circle.play(keyframe, offset, self.clock.scale)
 
     def end_intro_breathing(self):
+        if os.environ.get("INTUITION_FRAME_STATS"):
+            print(f"breathing: {self.breath_cycle.report()}")
+            print(f"breathing: {self.breath_circle.report()}")
+        self.breath_circle.stop()
         self.breath_label.setText("Let's start the training")
-        start_btn = QPushButton("Start")
-        start_btn.clicked.connect(self.start_game)
-        self.breath_layout.addWidget(start_btn)
+        self.start_button.show()
 
     def start_game(self):
-        self.stack.setCurrentWidget(self.game_screen)
+        self.session.start_game()
+        self.stats.reset()
+        self.show_screen("game", prebuild="end")
+        self.stats_label.setText(self.stats.text())
         self.next_round()
 
     def next_round(self):
+        if self.session.state != ROUNDS:
+            return
         self.guess_entry.hide()
-        if self.mode == "Think":
-            self.game_label.setText("Think of a number...")
-            QTimer.singleShot(3000, self.show_number)
+        self.game_label.setText(self.session.next_round())
+        if self.session.awaiting == "reveal":
+            self.timers.call_later(3000, self.show_number)
         else:
-            self.game_label.setText("Type your number and press Enter")
             self.guess_entry.show()
             self.guess_entry.setFocus()
 
     def show_number(self):
-        low, high = self.ranges[self.difficulty]
-        num = random.randint(low, high)
-        self.game_label.setText(f"The number was {num}")
-        self.streak += 1
-        QTimer.singleShot(2000, self.next_round)
+        if self.session.state != ROUNDS:
+            return
+        result = self.session.reveal()
+        self.game_label.setText(result.text)
+        self.play_tone(600)
+        self.timers.call_later(2000, self.next_round)
 
     def check_guess(self):
-        low, high = self.ranges[self.difficulty]
         try:
-            guess = int(self.guess_entry.text())
+            result = self.session.submit_guess(self.guess_entry.text())
         except ValueError:
-            self.game_label.setText("Enter a valid number")
+            self.game_label.setText(INVALID_GUESS)
             return
 
-        cheat_chance = 0.15
-        num = guess if random.random() < cheat_chance else random.randint(low, high)
         self.guess_entry.clear()
         self.guess_entry.hide()
+        self.game_label.setText(result.text)
+        self.play_tone(800 if result.hit else 400)
+        self.timers.call_later(2000, self.next_round)
 
-        if guess == num:
-            self.game_label.setText(f"Correct! The number was {num}")
-            self.streak += 1
-        else:
-            self.game_label.setText(f"The number was {num}")
-        QTimer.singleShot(2000, self.next_round)
+    def play_tone(self, freq):
+        if self.audio is not None and self.sound_check.isChecked():
+            self.audio.play(freq)
+
+    def on_round(self, session, result):
+        self.stats.update(session, result)
+        self.stats_label.setText(self.stats.text())
 
     def end_game(self):
-        self.streak_label.setText(f"Your streak: {self.streak}")
-        self.stack.setCurrentWidget(self.end_screen)
+        self.show_screen("end")
+        streak = self.session.end()
+        self.streak_label.setText(self.stats.end_text())
+        if self.store is not None:
+            self.store.end_session(self.session, streak)
+        if self.kiosk:
+            self.timers.call_later(KIOSK_RESTART_MS, self.restart)
+
+    def restart(self):
+        self.session.restart()
+        self.show_screen("intro")
+
+
+def main():
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    app = QApplication(sys.argv)
+    trainer = IntuitionTrainer()
+    if trainer.kiosk:
+        trainer.showFullScreen()
+    else:
+        trainer.show()
+    if os.environ.get("INTUITION_EXIT_AFTER_SHOW"):  # start-time measurements
+        QTimer.singleShot(0, app.quit)
+    return app.exec_()
 
 
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    trainer = IntuitionTrainer()
-    trainer.show()
-    sys.exit(app.exec_())
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# Intuition Trainer — Launcher
+#
+# Starts the Qt frontend (installer.py) or the Tk frontend (app_v6.py) and
+# imports only that toolkit. The toolkit comes from --toolkit, then the
+# INTUITION_TOOLKIT environment variable, then "toolkit" under [app] in
+# ~/.config/intuition-trainer/settings.ini; Qt is the default.
+#
+# --kiosk (or INTUITION_KIOSK=1) loops the sessions for unattended displays.
+#
+#   python main.py [--toolkit qt|tk] [--kiosk] [--import-only]
+
+import os
+import sys
+
+TOOLKITS = ("qt", "tk")
+CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".config", "intuition-trainer", "settings.ini")
+
+
+def configured_toolkit(path=CONFIG_PATH):
+    if not os.path.exists(path):
+        return None
+    import configparser
+
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config.get("app", "toolkit", fallback=None)
+
+
+def choose_toolkit(toolkit=None):
+    toolkit = (toolkit or os.environ.get("INTUITION_TOOLKIT") or configured_toolkit() or "qt").lower()
+    if toolkit not in TOOLKITS:
+        sys.exit(f"unknown toolkit '{toolkit}', expected one of: {', '.join(TOOLKITS)}")
+    return toolkit
+
+
+def import_frontend(toolkit):
+    # What a launch imports before its first window; neither frontend creates
+    # a window at import time
+    if toolkit == "qt":
+        import installer
+        return installer
+    import app_v6
+    return app_v6
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Start the Intuition Trainer")
+    parser.add_argument("--toolkit", help="qt or tk (default: INTUITION_TOOLKIT, settings.ini, then qt)")
+    parser.add_argument("--kiosk", action="store_true", help="loop the sessions for unattended displays")
+    parser.add_argument("--import-only", action="store_true",
+                        help="import the frontend and exit (for tools/check_importtime.py)")
+    args = parser.parse_args(argv)
+
+    toolkit = choose_toolkit(args.toolkit)
+    if args.kiosk:
+        os.environ["INTUITION_KIOSK"] = "1"
+    frontend = import_frontend(toolkit)
+    if args.import_only:
+        return 0
+    return frontend.main()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# Intuition Trainer — Breathing Patterns
+#
+# A pattern is a list of (kind, seconds) steps plus a repeat count. It is
+# compiled once into a Timeline: a flat table of keyframes
+# (label, start_ms, duration_ms, start_radius, end_radius, curve) that a
+# frontend plays with a single timer.
+
+import bisect
+import os
+import re
+
+import curves
+
+MIN_RADIUS = 50
+MAX_RADIUS = 120
+
+STEP_KINDS = {
+    # kind: (label, start_radius, end_radius, curve)
+    "inhale": ("Inhale", MIN_RADIUS, MAX_RADIUS, "sine"),
+    "hold": ("Pause", MAX_RADIUS, MAX_RADIUS, "hold"),
+    "exhale": ("Exhale", MAX_RADIUS, MIN_RADIUS, "sine"),
+    "rest": ("Pause", MIN_RADIUS, MIN_RADIUS, "hold"),
+}
+SPEC_KINDS = {
+    2: ("inhale", "exhale"),
+    3: ("inhale", "hold", "exhale"),
+    4: ("inhale", "hold", "exhale", "rest"),
+}
+
+
+class Timeline:
+    def __init__(self, name, keyframes):
+        self.name = name
+        self.keyframes = tuple(keyframes)
+        self.starts = [k[1] for k in self.keyframes]
+        last = self.keyframes[-1]
+        self.total_ms = last[1] + last[2]
+
+    def __len__(self):
+        return len(self.keyframes)
+
+    def index_at(self, elapsed_ms):
+        return max(0, bisect.bisect_right(self.starts, elapsed_ms) - 1)
+
+    def radius_at(self, elapsed_ms):
+        keyframe = self.keyframes[self.index_at(elapsed_ms)]
+        return curves.radius_at(keyframe, elapsed_ms - keyframe[1])
+
+
+class BreathPattern:
+    def __init__(self, name, steps, repeats=1):
+        if repeats < 1:
+            raise ValueError("repeats must be at least 1")
+        for kind, seconds in steps:
+            if kind not in STEP_KINDS:
+                raise ValueError(f"unknown breathing step '{kind}'")
+            if seconds < 0:
+                raise ValueError("step durations cannot be negative")
+        self.name = name
+        self.steps = tuple(steps)
+        self.repeats = repeats
+        self._timeline = None
+
+    def compile(self):
+        if self._timeline is None:
+            keyframes = []
+            offset = 0
+            for _ in range(self.repeats):
+                for kind, seconds in self.steps:
+                    duration = round(seconds * 1000)
+                    if duration == 0:
+                        continue
+                    label, r0, r1, curve = STEP_KINDS[kind]
+                    keyframes.append((label, offset, duration, r0, r1, curve))
+                    offset += duration
+            if not keyframes:
+                raise ValueError(f"pattern '{self.name}' has no timed steps")
+            self._timeline = Timeline(self.name, keyframes)
+        return self._timeline
+
+
+def custom(inhale, hold=0, exhale=None, rest=0, repeats=1, name="custom"):
+    exhale = inhale if exhale is None else exhale
+    return BreathPattern(name, [("inhale", inhale), ("hold", hold), ("exhale", exhale), ("rest", rest)], repeats)
+
+
+PATTERNS = {
+    "box": custom(4, 4, 4, 4, name="box"),
+    "4-7-8": custom(4, 7, 8, repeats=4, name="4-7-8"),
+    "coherent": custom(5.5, 0, 5.5, repeats=3, name="coherent"),
+}
+
+
+def parse_pattern(spec):
+    # "box", "4-7-8", "box x3", or seconds such as "4-4-4-4", "5.5-5.5x6"
+    match = re.fullmatch(r"\s*([\w.-]+?)\s*(?:x(\d+))?\s*", spec)
+    if not match:
+        raise ValueError(f"invalid breathing pattern '{spec}'")
+    name, repeats = match.group(1), match.group(2)
+    if name in PATTERNS:
+        base = PATTERNS[name]
+        if repeats is None:
+            return base
+        return BreathPattern(base.name, base.steps, int(repeats))
+
+    try:
+        seconds = [float(part) for part in name.split("-")]
+    except ValueError:
+        raise ValueError(f"unknown breathing pattern '{spec}'") from None
+    if len(seconds) not in SPEC_KINDS:
+        raise ValueError(f"breathing pattern '{spec}' needs 2 to 4 durations")
+    steps = list(zip(SPEC_KINDS[len(seconds)], seconds))
+    return BreathPattern(spec.strip(), steps, int(repeats or 1))
+
+
+def pattern_from_env():
+    return parse_pattern(os.environ.get("INTUITION_BREATH_PATTERN", "box"))
+
+
+def timeline_from_env():
+    # For the frontends, before their first window: a bad pattern ends the
+    # launch with its reason instead of failing later inside a timer callback
+    try:
+        return pattern_from_env().compile()
+    except ValueError as exc:
+        raise SystemExit(f"INTUITION_BREATH_PATTERN: {exc}") from None
@@ -0,0 +1,268 @@
+# Intuition Trainer — Round Log (no GUI toolkit imports)
+#
+# Every played round is appended to a binary log as one fixed-width record:
+# a 16-byte header, then 32-byte little-endian records, one write per round.
+# RoundHistory maps the file read-only and decodes records on demand, or
+# exposes the whole log as a NumPy structured array without copying, so
+# statistics over millions of rounds need no parsing step.
+#
+#   python roundlog.py stats [--path rounds.bin]
+#   python roundlog.py bench --rounds 1000000     write a synthetic log, time the read
+
+import os
+import struct
+import time
+from collections import namedtuple
+
+from session import RANGES
+
+LOG_PATH = os.environ.get(
+    "INTUITION_ROUND_LOG",
+    os.path.join(os.path.expanduser("~"), ".local", "share", "intuition-trainer", "rounds.bin"),
+)
+MAGIC = b"ITRL"
+VERSION = 1
+HEADER = struct.Struct("<4sHH8x")
+# timestamp, latency ms, guess, target, low, high, difficulty, mode, flags
+RECORD = struct.Struct("<dfiiHHBBB5x")
+DIFFICULTY_OFFSET = struct.calcsize("<dfiiHH")
+MODE_OFFSET = DIFFICULTY_OFFSET + 1
+FLAGS_OFFSET = DIFFICULTY_OFFSET + 2
+DTYPE_FIELDS = [
+    ("timestamp", "<f8"), ("latency_ms", "<f4"), ("guess", "<i4"), ("target", "<i4"),
+    ("low", "<u2"), ("high", "<u2"), ("difficulty", "u1"), ("mode", "u1"), ("flags", "u1"), ("_pad", "V5"),
+]
+
+DIFFICULTIES = tuple(RANGES)
+MODES = ("Think", "Input")
+GUESSED = MODES.index("Input")  # only Input rounds carry a guess
+HIT = 1
+CHEAT = 2
+NO_GUESS = -(1 << 31)  # Think rounds have no guess
+INT32_MAX = (1 << 31) - 1
+
+Round = namedtuple("Round", "timestamp latency_ms guess target low high difficulty mode hit cheat")
+
+
+class RoundLogError(ValueError):
+    pass
+
+
+def _check_header(data, path):
+    if len(data) < HEADER.size:
+        raise RoundLogError(f"{path} is not a version {VERSION} round log")
+    magic, version, size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or size != RECORD.size:
+        raise RoundLogError(f"{path} is not a version {VERSION} round log")
+
+
+def pack(session, result, timestamp=None):
+    low, high = session.ranges[session.difficulty]
+    flags = (HIT if result.hit else 0) | (CHEAT if result.cheat else 0)
+    guess = NO_GUESS if result.guess is None else max(NO_GUESS + 1, min(result.guess, INT32_MAX))
+    target = max(NO_GUESS + 1, min(result.number, INT32_MAX))  # a cheat round's target is the guess
+    return RECORD.pack(
+        time.time() if timestamp is None else timestamp, result.latency_ms, guess, target, low, high,
+        DIFFICULTIES.index(session.difficulty), MODES.index(session.mode), flags,
+    )
+
+
+class RoundLog:
+    # Append side; use as a session listener: session.on_round.append(log.append)
+    def __init__(self, path=LOG_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a+b", buffering=0)  # unbuffered: each record is one write()
+        try:
+            self._open_log(path)
+        except (OSError, RoundLogError):
+            self._file.close()
+            raise
+        self.appended = 0
+
+    def _open_log(self, path):
+        header = HEADER.pack(MAGIC, VERSION, RECORD.size)
+        size = self._file.seek(0, os.SEEK_END)
+        if size < HEADER.size:
+            self._file.seek(0)
+            if not header.startswith(self._file.read(size)):
+                raise RoundLogError(f"{path} is not a version {VERSION} round log")
+            self._file.truncate(0)  # empty, or a header cut short by a crash
+            self._file.write(header)
+        else:
+            self._file.seek(0)
+            _check_header(self._file.read(HEADER.size), path)
+            torn = (size - HEADER.size) % RECORD.size
+            if torn:  # a record cut short by a crash would misalign every later one
+                self._file.truncate(size - torn)
+
+    def append(self, session, result):
+        self._file.write(pack(session, result))
+        self.appended += 1
+
+    def close(self):
+        self._file.close()
+
+
+def attach(session, path=LOG_PATH):
+    # Logs every round the session plays; returns the RoundLog, or None when
+    # logging is off (INTUITION_ROUND_LOG set to "") or the log is unusable
+    if not path:
+        return None
+    try:
+        log = RoundLog(path)
+    except (OSError, RoundLogError):
+        return None  # history is best-effort; never keep the trainer from starting
+    session.on_round.append(log.append)
+    return log
+
+
+class RoundHistory:
+    def __init__(self, path=LOG_PATH):
+        import mmap
+
+        self.path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:  # mmap cannot map an empty file
+                raise RoundLogError(f"{path} is not a version {VERSION} round log")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            _check_header(self._map, path)
+        except RoundLogError:
+            self._map.close()
+            raise
+        self.count = (len(self._map) - HEADER.size) // RECORD.size
+
+    def __len__(self):
+        return self.count
+
+    def _decode(self, fields):
+        timestamp, latency, guess, target, low, high, difficulty, mode, flags = fields
+        return Round(timestamp, latency, None if guess == NO_GUESS else guess, target, low, high,
+                     DIFFICULTIES[difficulty], MODES[mode], bool(flags & HIT), bool(flags & CHEAT))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("round index out of range")
+        return self._decode(RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size))
+
+    def __iter__(self):
+        end = HEADER.size + self.count * RECORD.size
+        for fields in RECORD.iter_unpack(memoryview(self._map)[HEADER.size:end]):
+            yield self._decode(fields)
+
+    def array(self):
+        # Zero-copy NumPy view of all records; needs numpy installed, and the
+        # view must be released before close()
+        import numpy
+
+        return numpy.frombuffer(self._map, dtype=numpy.dtype(DTYPE_FIELDS), count=self.count, offset=HEADER.size)
+
+    def summary(self):
+        # Guessed rounds and hits per difficulty; Think rounds have no guess
+        # and would only dilute the hit rate
+        try:
+            records = self.array()
+        except ImportError:
+            records = None
+        stats = {name: [0, 0] for name in DIFFICULTIES}
+        if records is not None:
+            import numpy
+
+            records = records[records["guess"] != NO_GUESS]
+            counts = numpy.bincount(records["difficulty"], minlength=len(DIFFICULTIES))
+            hits = numpy.bincount(records["difficulty"], weights=records["flags"] & HIT, minlength=len(DIFFICULTIES))
+            for i, name in enumerate(DIFFICULTIES):
+                stats[name] = [int(counts[i]), int(hits[i])]
+            return stats
+        # Without NumPy: strided slices pull one byte per record out of the
+        # map, the guessed and hit bits are OR-ed onto the difficulty byte
+        # through one big-int operation, and the counting runs in C
+        end = HEADER.size + self.count * RECORD.size
+        difficulties = self._map[HEADER.size + DIFFICULTY_OFFSET:end:RECORD.size]
+        guessed = self._map[HEADER.size + MODE_OFFSET:end:RECORD.size].translate(
+            bytes(0x80 if i == GUESSED else 0 for i in range(256)))
+        hits = self._map[HEADER.size + FLAGS_OFFSET:end:RECORD.size].translate(
+            bytes(0x40 if i & HIT else 0 for i in range(256)))
+        codes = (int.from_bytes(difficulties, "little") | int.from_bytes(guessed, "little")
+                 | int.from_bytes(hits, "little")).to_bytes(self.count, "little")
+        for i, name in enumerate(DIFFICULTIES):
+            hit_count = codes.count(bytes([i | 0x80 | 0x40]))
+            stats[name] = [codes.count(bytes([i | 0x80])) + hit_count, hit_count]
+        return stats
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def print_stats(path):
+    # Returns False, after saying why, when there is no readable log
+    start = time.perf_counter()
+    try:
+        history = RoundHistory(path)
+    except FileNotFoundError:
+        print(f"{path}: no round log yet")
+        return False
+    except (OSError, RoundLogError) as exc:
+        print(f"{path}: cannot read the round log: {exc}")
+        return False
+    with history:
+        opened = (time.perf_counter() - start) * 1000
+        stats = history.summary()
+        total = (time.perf_counter() - start) * 1000
+        print(f"{path}: {len(history):,} rounds; opened in {opened:.2f} ms, summarized in {total:.1f} ms")
+    for name, (rounds, hits) in stats.items():
+        if rounds:
+            print(f"  {name}: {rounds:,} guessed rounds, hit rate {hits / rounds:.1%}")
+    return True
+
+
+def write_synthetic(path, rounds, seed=None):
+    import random
+
+    from session import TrainerSession
+
+    session = TrainerSession(rng=random.Random(seed))
+    session.start_breathing()
+    session.start_game()
+    records = bytearray()
+    timestamp = time.time()
+    for i in range(rounds):
+        session.difficulty = DIFFICULTIES[i % len(DIFFICULTIES)]
+        session.mode = MODES[i // len(DIFFICULTIES) % 2]
+        session.next_round()
+        result = session.reveal() if session.mode == "Think" else session.submit_guess("7")
+        records += pack(session, result, timestamp + i)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        f.write(records)
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Inspect or benchmark the round log")
+    parser.add_argument("command", choices=["stats", "bench"])
+    parser.add_argument("--path", default=LOG_PATH)
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="synthetic rounds for bench")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        sys.exit(0 if print_stats(args.path) else 1)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rounds.bin")
+            write_synthetic(path, args.rounds, seed=1)
+            print_stats(path)
@@ -0,0 +1,181 @@
+# Intuition Trainer — Session Engine (no GUI toolkit imports)
+
+import random
+import time
+from collections import namedtuple
+from functools import partial
+
+INTRO = "intro"
+BREATHING = "breathing"
+ROUNDS = "rounds"
+END = "end"
+
+RANGES = {
+    "Easy": (1, 10),
+    "Medium": (1, 30),
+    "Hard": (1, 60),
+    "Expert": (1, 99)
+}
+AFFIRMATIONS = [
+    "Trust your inner knowing.",
+    "Your intuition is growing stronger.",
+    "You already know the answer.",
+    "Calm mind, clear vision.",
+    "Let your inner voice guide you."
+]
+CHEAT_CHANCE = 0.15
+
+THINK_PROMPT = "Think of a number..."
+INPUT_PROMPT = "Type your number and press Enter"
+INVALID_GUESS = "Enter a valid number"
+
+
+class SessionStateError(RuntimeError):
+    pass
+
+
+class RoundResult(namedtuple("RoundResult", "number guess hit cheat latency_ms")):
+    __slots__ = ()
+
+    @property
+    def text(self):
+        if self.hit:
+            return f"Correct! The number was {self.number}"
+        return f"The number was {self.number}"
+
+
+def _monotonic_ms():
+    return time.monotonic() * 1000
+
+
+_new_result = tuple.__new__  # RoundResult without the namedtuple's Python-level __new__
+
+
+class TrainerSession:
+    # now: zero-argument callable returning milliseconds, used for response
+    # latency (from the prompt to the reveal or guess). on_round: callables
+    # run as listener(session, result) after every round.
+    def __init__(self, difficulty="Easy", mode="Think", rng=None, now=None):
+        self.rng = rng or random.Random()
+        self.now = now or _monotonic_ms
+        # The round path reads the clock twice per round; without a custom
+        # clock it calls time.monotonic directly and scales only the latency
+        self._clock, self._clock_ms = (now, 1) if now else (time.monotonic, 1000)
+        self.on_round = []
+        self.ranges = RANGES
+        self.affirmations = AFFIRMATIONS
+        self.difficulty = difficulty
+        self.mode = mode
+        self.state = INTRO
+        self.streak = 0
+        self.rounds = 0
+        self.awaiting = None
+        self._prompted = None
+
+    def _expect(self, *states):
+        if self.state not in states:
+            raise SessionStateError(f"not allowed in state '{self.state}'")
+
+    def start_breathing(self):
+        self._expect(INTRO)
+        self.state = BREATHING
+        return self.rng.choice(self.affirmations)
+
+    def start_game(self):
+        self._expect(BREATHING)
+        self.state = ROUNDS
+
+    # --- rounds: the per-round hot path, kept free of helper calls ---
+
+    def next_round(self):
+        if self.state != ROUNDS:
+            self._expect(ROUNDS)
+        self._prompted = self._clock()
+        if self.mode == "Think":
+            self.awaiting = "reveal"
+            return THINK_PROMPT
+        self.awaiting = "guess"
+        return INPUT_PROMPT
+
+    def reveal(self):
+        if self.awaiting != "reveal":  # only next_round() sets it, in the rounds state
+            self._expect(ROUNDS)
+            raise SessionStateError("no number pending reveal")
+        latency = (self._clock() - self._prompted) * self._clock_ms
+        low, high = self.ranges[self.difficulty]
+        self.awaiting = None
+        self.rounds += 1
+        self.streak += 1
+        result = _new_result(RoundResult, (low + int(self.rng.random() * (high - low + 1)), None, False, False, latency))
+        for listener in self.on_round:
+            listener(self, result)
+        return result
+
+    def submit_guess(self, text):
+        if self.awaiting != "guess":  # only next_round() sets it, in the rounds state
+            self._expect(ROUNDS)
+            raise SessionStateError("no guess expected")
+        guess = int(text)  # ValueError propagates; the round stays open
+
+        latency = (self._clock() - self._prompted) * self._clock_ms
+        draw = self.rng.random
+        cheat = draw() < CHEAT_CHANCE
+        if cheat:
+            num = guess
+        else:
+            low, high = self.ranges[self.difficulty]
+            num = low + int(draw() * (high - low + 1))
+        self.awaiting = None
+        self.rounds += 1
+        hit = guess == num
+        if hit:
+            self.streak += 1
+        result = _new_result(RoundResult, (num, guess, hit, cheat, latency))
+        for listener in self.on_round:
+            listener(self, result)
+        return result
+
+    def end(self):
+        self.state = END
+        self.awaiting = None
+        return self.streak
+
+    def restart(self):
+        # Back to the intro for another session, keeping difficulty and mode
+        self.state = INTRO
+        self.awaiting = None
+        self.streak = 0
+        self.rounds = 0
+        self._prompted = None
+
+
+def run_headless(rounds, difficulty="Easy", mode="Think", guess=None, seed=None):
+    session = TrainerSession(difficulty, mode, random.Random(seed))
+    session.start_breathing()
+    session.start_game()
+    if guess is None:
+        guess = session.ranges[difficulty][0]
+    # The frontends' own transitions, so the rate measured here is theirs
+    next_round = session.next_round
+    answer = session.reveal if mode == "Think" else partial(session.submit_guess, guess)
+    for _ in range(rounds):
+        next_round()
+        answer()
+    return session.end()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run trainer sessions without a GUI")
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    parser.add_argument("--difficulty", choices=list(RANGES), default="Easy")
+    parser.add_argument("--mode", choices=["Think", "Input"], default="Input")
+    parser.add_argument("--guess", type=int)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    streak = run_headless(args.rounds, args.difficulty, args.mode, args.guess, args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"{args.rounds} rounds in {elapsed:.3f}s ({args.rounds / elapsed:,.0f} rounds/s), streak {streak}")
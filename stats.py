@@ -0,0 +1,105 @@
+# Intuition Trainer — Live Session Statistics (no GUI toolkit imports)
+#
+# Updated once per round in constant time, never by rescanning history:
+# hit rate against the chance rate of the ranges played, current and best
+# run of consecutive hits, an exponentially weighted hit rate, and
+# mean/deviation of response time (Welford's method). reset() starts these
+# over for a new session; the per-difficulty hit counts carry across the
+# sessions, since a session plays only one difficulty. Only Input rounds are
+# scored; Think rounds have no guess and are just counted.
+# to_dict()/from_dict() round-trip through JSON so a session can be resumed.
+
+import math
+
+EWMA_ALPHA = 0.2  # weight of the newest round in the trend
+
+
+class LiveStats:
+    FIELDS = ("alpha", "rounds", "scored", "hits", "expected_hits", "by_difficulty", "streak", "best_streak",
+              "ewma", "latency_count", "latency_mean", "latency_m2")
+
+    def __init__(self, alpha=EWMA_ALPHA):
+        self.alpha = alpha
+        self.by_difficulty = {}  # difficulty: [scored, hits], over all sessions
+        self.reset()
+
+    def reset(self):
+        self.rounds = 0
+        self.scored = 0
+        self.hits = 0
+        self.expected_hits = 0.0  # sum of each scored round's chance of a hit
+        self.streak = 0
+        self.best_streak = 0
+        self.ewma = None
+        self.latency_count = 0
+        self.latency_mean = 0.0
+        self.latency_m2 = 0.0
+
+    def update(self, session, result):
+        # Session listener: session.on_round.append(stats.update)
+        self.rounds += 1
+        if result.guess is None:
+            return
+        low, high = session.ranges[session.difficulty]
+        hit = 1 if result.hit else 0
+        self.scored += 1
+        self.hits += hit
+        self.expected_hits += 1 / (high - low + 1)
+        counts = self.by_difficulty.setdefault(session.difficulty, [0, 0])
+        counts[0] += 1
+        counts[1] += hit
+
+        self.streak = self.streak + 1 if hit else 0
+        self.best_streak = max(self.best_streak, self.streak)
+        self.ewma = hit if self.ewma is None else self.ewma + self.alpha * (hit - self.ewma)
+
+        self.latency_count += 1
+        delta = result.latency_ms - self.latency_mean
+        self.latency_mean += delta / self.latency_count
+        self.latency_m2 += delta * (result.latency_ms - self.latency_mean)
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.scored if self.scored else 0.0
+
+    @property
+    def chance_rate(self):
+        return self.expected_hits / self.scored if self.scored else 0.0
+
+    def hit_rate_for(self, difficulty):
+        scored, hits = self.by_difficulty.get(difficulty, (0, 0))
+        return hits / scored if scored else 0.0
+
+    @property
+    def latency_sd(self):
+        return math.sqrt(self.latency_m2 / (self.latency_count - 1)) if self.latency_count > 1 else 0.0
+
+    def text(self):
+        if not self.scored:
+            return f"Rounds: {self.rounds}"
+        by_difficulty = " · ".join(f"{name} {hits}/{scored} ({hits / scored:.0%})"
+                                   for name, (scored, hits) in self.by_difficulty.items())
+        return (f"Hits {self.hits}/{self.scored} ({self.hit_rate:.0%}, chance {self.chance_rate:.0%}) · "
+                f"run {self.streak}, best {self.best_streak}\n"
+                f"Trend {self.ewma:.0%} · answer in {self.latency_mean / 1000:.1f} ± {self.latency_sd / 1000:.1f} s\n"
+                f"All sessions: {by_difficulty}")
+
+    def end_text(self):
+        # One line for the end screen
+        if not self.scored:
+            return f"Rounds: {self.rounds}"
+        return f"Hits {self.hits}/{self.scored} ({self.hit_rate:.0%}) · best run {self.best_streak}"
+
+    def to_dict(self):
+        state = {name: getattr(self, name) for name in self.FIELDS}
+        state["by_difficulty"] = {name: list(counts) for name, counts in self.by_difficulty.items()}
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        stats = cls(state.get("alpha", EWMA_ALPHA))
+        for name in cls.FIELDS:
+            if name in state:
+                setattr(stats, name, state[name])
+        stats.by_difficulty = {name: list(counts) for name, counts in stats.by_difficulty.items()}
+        return stats
@@ -0,0 +1,324 @@
+# Intuition Trainer — Session Store (no GUI toolkit imports)
+#
+# Sessions and rounds of every user in one SQLite database in WAL mode. The
+# GUI thread only puts rows on a queue; a writer thread owns the write
+# connection and commits in batches: every BATCH_SIZE rows, COMMIT_DELAY_S
+# after the first uncommitted row, and on flush() (end of a session) and
+# close() (shutdown). The writer blocks without a timeout while it has
+# nothing to commit, so an idle trainer causes no wake-ups.
+#
+# Queries read through their own read-only connection, which never creates
+# the database or its schema (only the writer does; until then queries come
+# back empty). They are served from partial indexes over scored data only:
+# guessed rounds by (user, difficulty, ts) and Input sessions by (user, ended).
+#
+#   python store.py stats [--user NAME]
+#   python store.py bench --rounds 200000     fill a temporary database, time the queries
+
+import os
+import queue
+import threading
+import time
+
+DB_PATH = os.environ.get(
+    "INTUITION_DB",
+    os.path.join(os.path.expanduser("~"), ".local", "share", "intuition-trainer", "history.sqlite3"),
+)
+BATCH_SIZE = 200
+COMMIT_DELAY_S = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    user TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    started REAL NOT NULL,
+    ended REAL,
+    rounds INTEGER NOT NULL DEFAULT 0,
+    streak INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    user TEXT NOT NULL,
+    ts REAL NOT NULL,
+    difficulty TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    low INTEGER NOT NULL,
+    high INTEGER NOT NULL,
+    guess INTEGER,
+    target INTEGER NOT NULL,
+    hit INTEGER NOT NULL,
+    cheat INTEGER NOT NULL,
+    latency_ms REAL NOT NULL
+);
+-- Partial indexes over what is scored: Think rounds have no guess and a
+-- Think session's streak counts reveals, not hits. hit and guess are
+-- carried in the rounds index so hit-rate queries never touch the table.
+CREATE INDEX IF NOT EXISTS guessed_rounds_user_difficulty_ts ON rounds (user, difficulty, ts, hit, guess)
+    WHERE guess IS NOT NULL;
+CREATE INDEX IF NOT EXISTS input_sessions_user_ended ON sessions (user, ended) WHERE mode = 'Input';
+"""
+INSERT_SESSION = "INSERT INTO sessions (user, difficulty, mode, started) VALUES (?, ?, ?, ?)"
+INSERT_ROUND = ("INSERT INTO rounds (session_id, user, ts, difficulty, mode, low, high, guess, target, hit, cheat,"
+                " latency_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+END_SESSION = "UPDATE sessions SET ended = ?, rounds = ?, streak = ? WHERE id = ?"
+
+HIT_RATES = """
+SELECT difficulty, COUNT(*), SUM(hit) FROM rounds INDEXED BY guessed_rounds_user_difficulty_ts
+WHERE user = ? AND ts >= ? AND guess IS NOT NULL GROUP BY difficulty
+"""
+STREAK_HISTORY = """
+SELECT ended, difficulty, mode, rounds, streak FROM sessions INDEXED BY input_sessions_user_ended
+WHERE user = ? AND ended IS NOT NULL AND mode = 'Input' ORDER BY ended DESC LIMIT ?
+"""
+
+_STOP = object()
+
+
+def default_user():
+    import getpass
+
+    return os.environ.get("INTUITION_USER") or getpass.getuser()
+
+
+def connect(path):
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # durable at checkpoints; enough for training history
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+def connect_readonly(path):
+    import pathlib
+    import sqlite3
+
+    conn = sqlite3.connect(pathlib.Path(path).resolve().as_uri() + "?mode=ro", uri=True)
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+class SessionStore:
+    def __init__(self, path=DB_PATH, user=None):
+        self.path = path
+        self.user = user or default_user()
+        self.error = None  # set by the writer if the database cannot be used
+        self.written = 0
+        self.commits = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._reader = None
+
+    # --- GUI thread: enqueue only ---
+
+    def _put(self, item):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="session-store", daemon=True)
+            self._thread.start()
+        self._queue.put(item)
+
+    def attach(self, session):
+        session.on_round.append(self.record_round)
+
+    def record_round(self, session, result):
+        now = time.time()
+        if session.rounds == 1:  # first round of a session opens its row
+            self._put((INSERT_SESSION, (self.user, session.difficulty, session.mode, now)))
+        low, high = session.ranges[session.difficulty]
+        self._put((INSERT_ROUND, (None, self.user, now, session.difficulty, session.mode, low, high,
+                                  result.guess, result.number, int(result.hit), int(result.cheat),
+                                  result.latency_ms)))
+
+    def end_session(self, session, streak):
+        # Call before session.restart(); sessions without rounds have no row
+        if session.rounds:
+            self._put((END_SESSION, (time.time(), session.rounds, streak, None)))
+        self.flush()
+
+    def flush(self, wait=False, timeout=5.0):
+        done = threading.Event()
+        self._put(done)
+        if wait:
+            done.wait(timeout)
+        return done
+
+    def close(self, timeout=5.0):
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    # --- writer thread ---
+
+    def _run(self):
+        import sqlite3
+
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = connect(self.path)
+            conn.executescript(SCHEMA)
+        except Exception as exc:  # history is best-effort; drain the queue so nothing waits on us
+            self.error = exc
+            while True:
+                item = self._queue.get()
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is _STOP:
+                    return
+
+        session_id = None
+        pending = 0
+        first_pending = None
+        while True:
+            timeout = None if not pending else max(0.0, first_pending + COMMIT_DELAY_S - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, tuple):
+                sql, params = item
+                try:
+                    if sql is INSERT_SESSION:
+                        session_id = None
+                        session_id = conn.execute(sql, params).lastrowid
+                    elif sql is INSERT_ROUND:
+                        conn.execute(sql, (session_id,) + params[1:])
+                    else:
+                        conn.execute(sql, params[:-1] + (session_id,))
+                except sqlite3.Error as exc:
+                    self.error = exc  # drop the row (a round without its session fails here too)
+                    continue
+                if not pending:
+                    first_pending = time.monotonic()
+                pending += 1
+                self.written += 1
+                if pending < BATCH_SIZE:
+                    continue
+
+            # Batch full, commit delay over, flush or shutdown
+            if pending:
+                conn.commit()
+                self.commits += 1
+                pending = 0
+            if item is _STOP:
+                conn.close()
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+
+    # --- queries (only from the thread that queried first, which the read
+    # connection is bound to; served from the indexes) ---
+
+    def _query(self, sql, params):
+        import sqlite3
+
+        if self._reader is None:
+            if not os.path.exists(self.path):
+                return []  # nothing written yet
+            self._reader = connect_readonly(self.path)
+        try:
+            return self._reader.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as exc:
+            if str(exc).startswith("no such"):  # the writer has not created the schema yet
+                return []
+            raise
+
+    def hit_rates(self, user=None, since=0.0):
+        # {difficulty: (guessed rounds, hits, rate)}
+        rows = self._query(HIT_RATES, (user or self.user, since))
+        return {difficulty: (rounds, hits, hits / rounds) for difficulty, rounds, hits in rows}
+
+    def streak_history(self, user=None, limit=20):
+        # [(ended, difficulty, mode, rounds, streak)] of Input sessions, most
+        # recent first; a Think session's streak is its number of reveals
+        return self._query(STREAK_HISTORY, (user or self.user, limit))
+
+    def query_plans(self, user=None):
+        return {name: [row[-1] for row in self._query("EXPLAIN QUERY PLAN " + sql, params)]
+                for name, sql, params in (("hit_rates", HIT_RATES, (user or self.user, 0.0)),
+                                          ("streak_history", STREAK_HISTORY, (user or self.user, 20)))}
+
+
+def attach(session, path=DB_PATH):
+    # Stores the session's rounds; returns the SessionStore, or None when the
+    # store is off (INTUITION_DB set to "")
+    if not path:
+        return None
+    store = SessionStore(path)
+    store.attach(session)
+    return store
+
+
+def print_stats(store, user=None):
+    start = time.perf_counter()
+    rates = store.hit_rates(user)
+    history = store.streak_history(user)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{user or store.user}: queried in {elapsed:.1f} ms")
+    for difficulty, (rounds, hits, rate) in sorted(rates.items()):
+        print(f"  {difficulty}: {rounds:,} guessed rounds, hit rate {rate:.1%}")
+    for ended, difficulty, mode, rounds, streak in history[:5]:
+        print(f"  {time.strftime('%Y-%m-%d %H:%M', time.localtime(ended))} {difficulty}/{mode}: "
+              f"{rounds} rounds, streak {streak}")
+
+
+def bench(rounds, users=20, per_session=50):
+    import random
+    import tempfile
+
+    from session import RANGES, TrainerSession
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.sqlite3")
+        rng = random.Random(1)
+        start = time.perf_counter()
+        enqueue = 0.0
+        for u in range(users):
+            store = SessionStore(path, f"user{u}")
+            for i in range(rounds // per_session // users):
+                session = TrainerSession(rng.choice(list(RANGES)), "Think" if i % 4 == 3 else "Input", rng)
+                store.attach(session)
+                session.start_breathing()
+                session.start_game()
+                started = time.perf_counter()
+                for _ in range(per_session):
+                    session.next_round()
+                    session.reveal() if session.mode == "Think" else session.submit_guess("3")
+                store.end_session(session, session.end())
+                enqueue += time.perf_counter() - started
+            store.close()
+        print(f"{rounds:,} rounds from {users} users written in {time.perf_counter() - start:.1f} s; "
+              f"{enqueue / rounds * 1e6:.1f} us per round on the playing thread")
+        store = SessionStore(path, "user0")
+        print_stats(store)
+        for name, plan in store.query_plans().items():
+            print(f"  plan {name}: {'; '.join(plan)}")
+        store.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query or benchmark the session store")
+    parser.add_argument("command", choices=["stats", "bench"])
+    parser.add_argument("--path", default=DB_PATH)
+    parser.add_argument("--user")
+    parser.add_argument("--rounds", type=int, default=200_000, help="synthetic rounds for bench")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        store = SessionStore(args.path, args.user)
+        print_stats(store)
+        store.close()
+    else:
+        bench(args.rounds)
@@ -0,0 +1,81 @@
+# Intuition Trainer — Themes
+#
+# One application-level stylesheet is generated from a palette. Widgets pick
+# their look through the "tone" property (title/accent/phase/body) instead of
+# carrying their own stylesheet, so Qt parses a single sheet and a theme
+# switch is one setStyleSheet() call on the application, which repolishes
+# existing widgets in place.
+
+import time
+
+PALETTES = {
+    "night": {
+        "text": "white",
+        "accent": "#5cd3ff",
+        "phase": "#66e0ff",
+        "panel": (0, 0, 0, 120),
+        "input_background": "white",
+        "input_text": "black",
+        "circle": "#5cd3ff",
+    },
+    "day": {
+        "text": "#1b2a33",
+        "accent": "#0b6e99",
+        "phase": "#0f8fbf",
+        "panel": (255, 255, 255, 170),
+        "input_background": "#fdfdfd",
+        "input_text": "#1b2a33",
+        "circle": "#0f8fbf",
+    },
+}
+DEFAULT_THEME = "night"
+
+
+def build_qss(palette):
+    panel = "rgba(%d,%d,%d,%d)" % palette["panel"]
+    return f"""
+QLabel[tone] {{ background-color: {panel}; color: {palette['text']}; }}
+QLabel[tone="accent"] {{ color: {palette['accent']}; }}
+QLabel[tone="phase"] {{ color: {palette['phase']}; }}
+QRadioButton, QCheckBox {{ color: {palette['text']}; }}
+QLabel[panel="composited"] {{ background-color: transparent; }}
+QLineEdit {{ background-color: {palette['input_background']}; color: {palette['input_text']}; }}
+"""
+
+
+class ThemeEngine:
+    def __init__(self, app):
+        self.app = app
+        self.name = None
+        self.palette = None
+        self.listeners = []  # callables(palette) for anything painted outside QSS
+        self.timings = {}
+        self._sheets = {}
+
+    def apply(self, name):
+        if name not in PALETTES:
+            raise ValueError(f"unknown theme '{name}', expected one of: {', '.join(PALETTES)}")
+        started = time.perf_counter()
+        sheet = self._sheets.get(name)
+        if sheet is None:
+            sheet = self._sheets[name] = build_qss(PALETTES[name])
+        self.app.setStyleSheet(sheet)
+        self.name = name
+        self.palette = PALETTES[name]
+        for listener in self.listeners:
+            listener(self.palette)
+        key = "theme:first" if "theme:first" not in self.timings else "theme:switch"
+        self.timings[key] = (time.perf_counter() - started) * 1000
+        return self.timings[key]
+
+    def polish(self, widget):
+        # Polish a freshly built screen now, so its cost is measured here
+        # rather than hidden inside the first show
+        started = time.perf_counter()
+        widget.ensurePolished()
+        ms = (time.perf_counter() - started) * 1000
+        self.timings["theme:polish"] = self.timings.get("theme:polish", 0.0) + ms
+        return ms
+
+    def report(self):
+        return ", ".join(f"{key} {ms:.2f} ms" for key, ms in self.timings.items())
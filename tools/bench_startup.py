@@ -0,0 +1,219 @@
+# Intuition Trainer — Startup Benchmark
+#
+# Launches every frontend generation headlessly in a fresh interpreter and
+# records toolkit import time, time to first shown window, peak RSS and the
+# latency of each screen transition. Qt runs on QT_QPA_PLATFORM=offscreen; Tk
+# needs an X display, and Xvfb is started for it when DISPLAY is unset.
+#
+#   python tools/bench_startup.py --runs 5 --output results.json
+#   python tools/bench_startup.py --compare before.json after.json
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINTS = [f"app_v{i}.py" for i in range(1, 8)] + ["installer.py"]
+TRANSITIONS = [
+    ("breathing", ("start_breathing_intro", "start_breathing")),
+    ("game", ("start_game",)),
+    ("end", ("end_game",)),
+]
+METRICS = ["import_ms", "first_window_ms", "peak_rss_kb"] + [f"to_{name}_ms" for name, _ in TRANSITIONS]
+
+
+# === Child side: runs inside the benchmarked interpreter ===
+
+def _peak_rss_kb():
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def _finish(result):
+    result["peak_rss_kb"] = _peak_rss_kb()
+    sys.stdout.write("\n" + json.dumps(result) + "\n")
+    sys.stdout.flush()
+    os._exit(0)  # skip pending timers and toolkit teardown
+
+
+def _transitions(result, targets, settle):
+    for name, candidates in TRANSITIONS:
+        for target in targets:
+            fn = next((getattr(target, c) for c in candidates if callable(getattr(target, c, None))), None)
+            if fn is None:
+                continue
+            started = time.perf_counter()
+            try:
+                fn()
+                settle()
+            except Exception as e:  # older generations are not all navigable out of order
+                result.setdefault("errors", []).append(f"{name}: {e!r}")
+            else:
+                result[f"to_{name}_ms"] = (time.perf_counter() - started) * 1000
+            break
+
+
+def run_child(path):
+    started = time.perf_counter()
+    result = {}
+    with open(path, encoding="utf-8") as f:
+        qt = "PyQt5" in f.read()
+
+    if qt:
+        from PyQt5.QtWidgets import QApplication
+        result["import_ms"] = (time.perf_counter() - started) * 1000
+
+        def exec_(app):
+            windows = [w for w in app.topLevelWidgets() if w.isWindow() and w.isVisible()]
+            while not any(w.windowHandle() and w.windowHandle().isExposed() for w in windows):
+                app.processEvents()
+            result["first_window_ms"] = (time.perf_counter() - started) * 1000
+            _transitions(result, windows, app.processEvents)
+            _finish(result)
+
+        QApplication.exec_ = exec_
+        QApplication.exec = exec_
+    else:
+        import tkinter
+        result["import_ms"] = (time.perf_counter() - started) * 1000
+
+        class Globals:
+            def __init__(self, namespace):
+                self.__dict__.update(namespace)
+
+        def mainloop(root, n=0):
+            root.wait_visibility()
+            root.update()
+            result["first_window_ms"] = (time.perf_counter() - started) * 1000
+            caller = sys._getframe(1)
+            # app_v6 builds its screens into a namespace; older generations are module-level scripts
+            target = caller.f_locals.get("app") or Globals(caller.f_globals)
+            _transitions(result, [target], root.update)
+            _finish(result)
+
+        tkinter.Misc.mainloop = mainloop
+
+    import runpy
+    sys.argv = [path]
+    runpy.run_path(path, run_name="__main__")
+    _finish(result)  # the script returned without entering a main loop
+
+
+# === Parent side ===
+
+def _start_display(env):
+    if sys.platform != "linux" or env.get("DISPLAY"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return None
+    proc = subprocess.Popen([xvfb, ":97", "-screen", "0", "1024x768x24"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    env["DISPLAY"] = ":97"
+    return proc
+
+
+def measure(entry, env):
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", entry],
+                          cwd=ROOT, env=env, capture_output=True, text=True, timeout=120)
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        return {"error": (proc.stderr.strip().splitlines() or ["no output"])[-1]}
+    return json.loads(lines[-1])
+
+
+def benchmark(entries, runs):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", INTUITION_CLOCK="virtual")
+    xvfb = _start_display(env)
+    results = {}
+    try:
+        for entry in entries:
+            samples = [measure(entry, env) for _ in range(runs)]
+            good = [s for s in samples if "error" not in s]
+            if not good:
+                results[entry] = {"error": samples[0]["error"]}
+                continue
+            results[entry] = {
+                m: statistics.median(s[m] for s in good) for m in METRICS if all(m in s for s in good)
+            }
+            errors = sorted({e for s in good for e in s.get("errors", [])})
+            if errors:
+                results[entry]["errors"] = errors
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def print_table(results):
+    print(f"{'entry point':<14}" + "".join(f"{m:>16}" for m in METRICS))
+    for entry, row in results.items():
+        if "error" in row:
+            print(f"{entry:<14}  skipped: {row['error']}")
+            continue
+        print(f"{entry:<14}" + "".join(f"{row[m]:>16.1f}" if m in row else f"{'-':>16}" for m in METRICS))
+
+
+def compare(before_path, after_path):
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    print(f"{before.get('commit')} -> {after.get('commit')}")
+    for entry, row in after["results"].items():
+        old = before["results"].get(entry, {})
+        for m in METRICS:
+            if m in row and m in old and old[m]:
+                change = 100 * (row[m] - old[m]) / old[m]
+                print(f"{entry:<14}{m:<18}{old[m]:>12.1f}{row[m]:>12.1f}{change:>+9.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark startup of every Intuition Trainer frontend")
+    parser.add_argument("entries", nargs="*", default=ENTRY_POINTS)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", help="write machine-readable results to this JSON file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, ROOT)
+        run_child(os.path.join(ROOT, args.child))
+        return
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = benchmark(args.entries, args.runs)
+    print_table(results)
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": args.runs,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+# Intuition Trainer — Label Repaint Benchmark
+#
+# Times the repaint that follows a setText() on the game and breathing labels,
+# with the background compositor on and off (INTUITION_COMPOSITE). Each mode
+# runs in its own process so neither inherits the other's pixmap cache.
+#
+#   python tools/bench_text_paint.py [--repeats 2000] [--dpr 2]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LABELS = {"game_label": "game", "breath_phase": "breath"}
+
+
+def child(repeats):
+    sys.path.insert(0, ROOT)
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    import installer
+
+    window = installer.IntuitionTrainer()
+    window.show()
+    app.processEvents()
+
+    results = {}
+    for attr, screen in LABELS.items():
+        window.show_screen(screen)
+        app.processEvents()
+        label = getattr(window, attr)
+        samples = []
+        for i in range(repeats):
+            label.setText(f"Round {i}: the number was {i % 100}")
+            started = time.perf_counter()
+            label.repaint()
+            samples.append((time.perf_counter() - started) * 1e6)
+        results[attr] = {"median_us": statistics.median(samples), "mean_us": statistics.fmean(samples)}
+    print(json.dumps(results))
+
+
+def run(composite, repeats, dpr):
+    env = dict(os.environ, INTUITION_COMPOSITE="1" if composite else "0", QT_SCALE_FACTOR=str(dpr))
+    if sys.platform == "linux" and not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run([sys.executable, __file__, "--child", "--repeats", str(repeats)],
+                          env=env, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare label repaint time with and without compositing")
+    parser.add_argument("--repeats", type=int, default=2000)
+    parser.add_argument("--dpr", type=float, default=1.0, help="device pixel ratio to emulate")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(args.repeats)
+
+    blended = run(False, args.repeats, args.dpr)
+    composited = run(True, args.repeats, args.dpr)
+    for attr in LABELS:
+        before, after = blended[attr]["median_us"], composited[attr]["median_us"]
+        print(f"{attr}: per-label panels {before:.0f} us, composited {after:.0f} us "
+              f"({(1 - after / before) * 100:.0f}% less)")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
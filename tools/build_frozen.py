@@ -0,0 +1,147 @@
+# Intuition Trainer — Frozen Builds
+#
+# Builds installer.py with PyInstaller. The default onedir mode ships an
+# already-unpacked directory, so launches skip the per-run extraction of the
+# Python runtime and Qt that --onefile performs. Unused Qt modules are
+# excluded and only the Qt plugins the app loads are kept. onefile mode
+# reproduces the current release build for comparison.
+#
+#   python tools/build_frozen.py [--mode onedir|onefile]
+#   python tools/measure_frozen_start.py dist/onedir/IntuitionTrainer/IntuitionTrainer dist/onefile/IntuitionTrainer
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NAME = "IntuitionTrainer"
+
+EXCLUDED_MODULES = [
+    "tkinter", "unittest", "pydoc", "doctest",
+    "PyQt5.QtBluetooth", "PyQt5.QtDBus", "PyQt5.QtDesigner", "PyQt5.QtHelp", "PyQt5.QtLocation",
+    "PyQt5.QtMultimedia", "PyQt5.QtMultimediaWidgets", "PyQt5.QtNetwork", "PyQt5.QtNfc",
+    "PyQt5.QtOpenGL", "PyQt5.QtPositioning", "PyQt5.QtPrintSupport", "PyQt5.QtQml", "PyQt5.QtQuick",
+    "PyQt5.QtQuickWidgets", "PyQt5.QtRemoteObjects", "PyQt5.QtSensors", "PyQt5.QtSerialPort",
+    "PyQt5.QtSql", "PyQt5.QtSvg", "PyQt5.QtTest", "PyQt5.QtTextToSpeech", "PyQt5.QtWebChannel",
+    "PyQt5.QtWebEngineCore", "PyQt5.QtWebEngineWidgets", "PyQt5.QtWebSockets", "PyQt5.QtXml",
+    "PyQt5.QtXmlPatterns",
+]
+# Qt plugin files kept in onedir builds, per plugin directory; directories not
+# listed are removed. The background is a JPEG; PNG support is built into Qt.
+KEPT_PLUGINS = {
+    "platforms": ("xcb", "wayland", "offscreen", "minimal.", "cocoa", "windows"),
+    "platforminputcontexts": None,
+    "platformthemes": None,
+    "xcbglintegrations": None,
+    "wayland-decoration-client": None,
+    "wayland-graphics-integration-client": None,
+    "wayland-shell-integration": None,
+    "styles": None,
+    "imageformats": ("qjpeg",),
+}
+
+
+def prune_plugins(dist):
+    removed = 0
+    for dirpath, dirnames, _ in os.walk(dist):
+        if os.path.basename(dirpath) == "plugins" and "platforms" in dirnames:
+            for plugin_dir in list(dirnames):
+                path = os.path.join(dirpath, plugin_dir)
+                if plugin_dir not in KEPT_PLUGINS:
+                    removed += _size(path)
+                    shutil.rmtree(path)
+                    continue
+                keep = KEPT_PLUGINS[plugin_dir]
+                if keep is None:
+                    continue
+                for name in os.listdir(path):
+                    if not any(k in name for k in keep):
+                        removed += _size(os.path.join(path, name))
+                        os.remove(os.path.join(path, name))
+            break
+    return removed
+
+
+def prune_qt_libraries(dist):
+    # Drop Qt shared libraries (Linux .so files) that are not reachable from
+    # the executable, the Python extension modules or the remaining plugins,
+    # e.g. QtQuick pulled in by plugins pruned above.
+    qt_libs = {}
+    roots = []
+    for d, _, files in os.walk(dist):
+        for f in files:
+            path = os.path.join(d, f)
+            if os.path.islink(path):
+                continue
+            if f.startswith("libQt5") and ".so" in f:
+                qt_libs[f.split(".so")[0] + ".so"] = path
+            elif ".so" in f or os.access(path, os.X_OK):
+                roots.append(path)
+
+    def linked(path):
+        with open(path, "rb") as f:
+            data = f.read()
+        return [soname for soname in qt_libs if soname.encode() in data]
+
+    keep = set()
+    pending = [soname for path in roots for soname in linked(path)]
+    while pending:
+        soname = pending.pop()
+        if soname not in keep:
+            keep.add(soname)
+            pending.extend(linked(qt_libs[soname]))
+
+    removed = 0
+    for soname, path in qt_libs.items():
+        if soname not in keep:
+            removed += os.path.getsize(path)
+            os.remove(path)
+    for d, _, files in os.walk(dist):
+        for f in files:
+            path = os.path.join(d, f)
+            if os.path.islink(path) and not os.path.exists(path):
+                os.remove(path)
+    return removed
+
+
+def _size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(path) for f in files)
+
+
+def build(mode, skip_resources=False):
+    if not skip_resources:
+        subprocess.run([sys.executable, os.path.join(ROOT, "tools", "build_resources.py")], cwd=ROOT, check=True)
+
+    distpath = os.path.join(ROOT, "dist", mode)
+    workpath = os.path.join(ROOT, "build", mode)
+    cmd = [sys.executable, "-m", "PyInstaller", "installer.py", "--noconfirm", "--windowed", "--name", NAME,
+           f"--{mode}", "--distpath", distpath, "--workpath", workpath, "--specpath", workpath]
+    if mode == "onedir":
+        for module in EXCLUDED_MODULES:
+            cmd += ["--exclude-module", module]
+    subprocess.run(cmd, cwd=ROOT, check=True)
+
+    target = os.path.join(distpath, NAME)
+    if mode == "onedir":
+        saved = prune_plugins(target)
+        if sys.platform == "linux":
+            saved += prune_qt_libraries(target)
+        print(f"pruned {saved // 1024} KB of unused Qt plugins and libraries")
+    print(f"{target}: {_size(target) // 1024} KB")
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a frozen Intuition Trainer")
+    parser.add_argument("--mode", choices=["onedir", "onefile"], default="onedir")
+    parser.add_argument("--skip-resources", action="store_true", help="reuse an existing resources_rc.py")
+    args = parser.parse_args()
+    build(args.mode, args.skip_resources)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# Intuition Trainer — Compiled Qt Resource Bundle
+#
+# Packs pre-scaled background variants, stylesheets (styles/*.qss) and sounds
+# (sounds/*.wav) into resources_rc.py, and the background pyramid into
+# pyramid_rc.py. Once imported, the app loads them from ":/" paths instead of
+# the filesystem, so frozen builds do not extract them and unfrozen runs work
+# from any working directory. The pyramid is only needed once the window is
+# resized, so it is kept out of the module imported at startup.
+#
+#   python tools/build_resources.py [--dpr 1 2]
+import argparse
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from xml.sax.saxutils import escape
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+OUTPUT = os.path.join(ROOT, "resources_rc.py")
+PYRAMID_OUTPUT = os.path.join(ROOT, "pyramid_rc.py")
+
+
+def collect(staging, size, dprs):
+    # Everything is staged under its alias next to the .qrc, since pyrcc5
+    # only resolves paths relative to the .qrc file.
+    from assets import JPEG_QUALITY, bundled_background_alias, render_variant
+
+    aliases = []
+    for dpr in dprs:
+        alias = bundled_background_alias(size[0], size[1], dpr)
+        os.makedirs(os.path.join(staging, os.path.dirname(alias)), exist_ok=True)
+        image = render_variant(os.path.join(ROOT, "trainer.jpg"), size[0], size[1], dpr)
+        image.save(os.path.join(staging, alias), "JPEG", JPEG_QUALITY)
+        aliases.append(alias)
+    for folder, pattern in (("styles", "*.qss"), ("sounds", "*.wav")):
+        for path in sorted(glob.glob(os.path.join(ROOT, folder, pattern))):
+            alias = f"{folder}/{os.path.basename(path)}"
+            os.makedirs(os.path.join(staging, folder), exist_ok=True)
+            shutil.copyfile(path, os.path.join(staging, alias))
+            aliases.append(alias)
+    return aliases
+
+
+def collect_pyramid(staging):
+    from assets import JPEG_QUALITY, pyramid_alias, render_pyramid
+
+    aliases = []
+    for level in render_pyramid(os.path.join(ROOT, "trainer.jpg")):
+        alias = pyramid_alias(level)
+        os.makedirs(os.path.join(staging, os.path.dirname(alias)), exist_ok=True)
+        level.save(os.path.join(staging, alias), "JPEG", JPEG_QUALITY)
+        aliases.append(alias)
+    return aliases
+
+
+def compile_qrc(staging, name, aliases, output):
+    write_qrc(os.path.join(staging, name), aliases)
+    subprocess.run([sys.executable, "-m", "PyQt5.pyrcc_main", "-compress", "9",
+                    "-o", os.path.abspath(output), name], cwd=staging, check=True)
+    for alias in aliases:
+        print(f":/{alias}")
+    print(f"wrote {output} ({os.path.getsize(output) // 1024} KB)")
+
+
+def write_qrc(path, aliases):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<!DOCTYPE RCC><RCC version=\"1.0\">\n<qresource>\n")
+        for alias in aliases:
+            f.write(f"  <file>{escape(alias)}</file>\n")
+        f.write("</qresource>\n</RCC>\n")
+
+
+def main():
+    from assets import DEFAULT_SIZE, BUNDLED_DPRS
+    from PyQt5.QtCore import QCoreApplication
+
+    parser = argparse.ArgumentParser(description="Compile images, styles and sounds into Qt resource modules")
+    parser.add_argument("--dpr", type=float, nargs="+", default=list(BUNDLED_DPRS))
+    parser.add_argument("--output", default=OUTPUT)
+    parser.add_argument("--pyramid-output", default=PYRAMID_OUTPUT)
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv[:1])  # image plugins only; no display needed
+    with tempfile.TemporaryDirectory() as staging:
+        compile_qrc(staging, "resources.qrc", collect(staging, DEFAULT_SIZE, args.dpr), args.output)
+        compile_qrc(staging, "pyramid.qrc", collect_pyramid(staging), args.pyramid_output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# Intuition Trainer — Import-Time Regression Check
+#
+# Runs "python -X importtime main.py --toolkit <tk> --import-only" for each
+# toolkit, alternating with a bare import of the toolkit itself (PyQt5
+# QtWidgets, or tkinter and ttk) so both see the same machine load. It fails
+# when:
+#   - the launcher path imports a top-level module that the baseline in
+#     importtime_budget.json does not (checked only on the Python version
+#     the baseline was taken with, whose standard library imports match);
+#   - the launcher's import time relative to the bare toolkit import grows
+#     past the baseline ratio plus 30% headroom;
+#   - a toolkit path imports a forbidden module (e.g. the Tk path pulling in
+#     PyQt5).
+# Absolute milliseconds depend on the machine and are only printed.
+#
+#   python tools/check_importtime.py            check against the baseline
+#   python tools/check_importtime.py --update   re-baseline from this machine
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(ROOT, "tools", "importtime_budget.json")
+FORBIDDEN = {
+    "qt": ["tkinter"],
+    "tk": ["PyQt5"],
+}
+REFERENCE = {
+    "qt": "import PyQt5.QtWidgets",
+    "tk": "import tkinter, tkinter.ttk",
+}
+HEADROOM = 1.3
+
+
+def sample(args):
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + args,
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    total_us = 0
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, field = line[len("import time:"):].split("|")
+        name = field.strip()
+        modules[name] = int(cumulative_us)
+        if len(field) - len(field.lstrip()) == 1:  # top level; nested imports are in its cumulative time
+            total_us += int(cumulative_us)
+    return total_us / 1000, modules
+
+
+def measure(toolkit, runs):
+    # Median launcher time, median launcher/reference ratio over paired runs,
+    # and the launcher's modules
+    totals = []
+    ratios = []
+    modules = {}
+    for _ in range(runs):
+        reference_ms, _ = sample(["-c", REFERENCE[toolkit]])
+        total_ms, modules = sample(["main.py", "--toolkit", toolkit, "--import-only"])
+        totals.append(total_ms)
+        ratios.append(total_ms / reference_ms)
+    return statistics.median(totals), statistics.median(ratios), modules
+
+
+def python_version():
+    return "{}.{}".format(*sys.version_info)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check frontend import time against a baseline")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--update", action="store_true", help="write a new baseline from this machine")
+    parser.add_argument("--toolkit", choices=sorted(FORBIDDEN), action="append")
+    args = parser.parse_args()
+
+    budget = {}
+    if os.path.exists(BUDGET_PATH):
+        with open(BUDGET_PATH) as f:
+            budget = json.load(f)
+
+    failed = False
+    for toolkit in args.toolkit or sorted(FORBIDDEN):
+        total_ms, ratio, modules = measure(toolkit, args.runs)
+        slowest = sorted(((ms, name) for name, ms in modules.items()), reverse=True)[:5]
+        print(f"{toolkit}: {total_ms:.1f} ms, {ratio:.2f}x the bare toolkit import; slowest: "
+              + ", ".join(f"{n} {us / 1000:.1f}" for us, n in slowest))
+        roots = sorted({name.split(".")[0] for name in modules})
+
+        leaked = [name for name in modules
+                  if any(name == f or name.startswith(f + ".") for f in FORBIDDEN[toolkit])]
+        if leaked:
+            print(f"  FAIL: {toolkit} path imports {', '.join(sorted(leaked))}")
+            failed = True
+
+        if args.update:
+            budget[toolkit] = {"python": python_version(), "max_ratio": round(ratio * HEADROOM, 2), "modules": roots}
+            continue
+        baseline = budget.get(toolkit)
+        if baseline is None:
+            continue
+        if ratio > baseline["max_ratio"]:
+            print(f"  FAIL: over the budget of {baseline['max_ratio']}x the bare toolkit import")
+            failed = True
+        if baseline.get("python") != python_version():
+            print(f"  module check skipped: baseline taken on Python {baseline.get('python')}")
+            continue
+        added = sorted(set(roots) - set(baseline["modules"]))
+        if added:
+            print(f"  FAIL: new imports on the {toolkit} path: {', '.join(added)}")
+            failed = True
+
+    if args.update:
+        with open(BUDGET_PATH, "w") as f:
+            json.dump(budget, f, indent=2)
+            f.write("\n")
+        print(f"wrote {BUDGET_PATH}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# Intuition Trainer — Frozen Start-Time Measurement
+#
+# Times launches of frozen builds until the first window is shown
+# (INTUITION_EXIT_AFTER_SHOW makes the app quit right after). The first
+# launch of each binary is reported as cold; as root on Linux the page cache
+# is dropped before it. The remaining launches are reported as warm.
+#
+#   python tools/measure_frozen_start.py dist/onedir/IntuitionTrainer/IntuitionTrainer \
+#       dist/onefile/IntuitionTrainer --runs 10
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def drop_caches():
+    if sys.platform != "linux" or os.geteuid() != 0:
+        return False
+    try:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+        return True
+    except OSError:
+        return False
+
+
+def launch(binary, env):
+    started = time.perf_counter()
+    subprocess.run([binary], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120, check=True)
+    return (time.perf_counter() - started) * 1000
+
+
+def measure(binary, runs, env):
+    dropped = drop_caches()
+    cold = launch(binary, env)
+    warm = [launch(binary, env) for _ in range(runs)]
+    return {"cold_ms": cold, "cold_page_cache_dropped": dropped,
+            "warm_median_ms": statistics.median(warm), "warm_min_ms": min(warm)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cold and warm start of frozen builds")
+    parser.add_argument("binaries", nargs="+")
+    parser.add_argument("--runs", type=int, default=5, help="warm launches per binary")
+    parser.add_argument("--output", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    env = dict(os.environ, INTUITION_EXIT_AFTER_SHOW="1")
+    if sys.platform == "linux" and not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    results = {}
+    for binary in args.binaries:
+        results[binary] = r = measure(os.path.abspath(binary), args.runs, env)
+        print(f"{binary}: cold {r['cold_ms']:.0f} ms, warm median {r['warm_median_ms']:.0f} ms "
+              f"(min {r['warm_min_ms']:.0f} ms)")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
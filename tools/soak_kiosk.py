@@ -0,0 +1,215 @@
+# Intuition Trainer — Kiosk Soak Test
+#
+# Runs a frontend in kiosk mode through many complete sessions (intro →
+# breathing → game → end → intro) on a VirtualClock, so each session costs
+# only its event handling. The Python heap (tracemalloc) and the toolkit's
+# object counts (Qt: the window's QObjects and all widgets; Tk: widgets and
+# Tcl commands, which also hold bound callbacks) are sampled after a warm-up
+# and again at the end; the run fails if the object counts changed or the
+# heap kept growing. It also fails if a round fires after its session ended,
+# if the end screen keeps more than the kiosk's own restart timer pending, or
+# if the breathing screen still shows the previous session's start prompt.
+# The Tk frontend needs an X display.
+#
+#   python tools/soak_kiosk.py [--toolkit qt|tk] [--sessions 10000] [--rounds 5]
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+# === Qt ===
+
+class QtHarness:
+    def __init__(self, clock):
+        from PyQt5.QtWidgets import QApplication
+
+        import installer
+
+        self.app = QApplication(sys.argv[:1])
+        self.window = installer.IntuitionTrainer(clock=clock, kiosk=True)
+        self.window.sound_check.setChecked(False)
+        self.window.show()
+        self.app.processEvents()
+        self.session = self.window.session
+        self.timers = self.window.timers
+
+    def counts(self):
+        from PyQt5.QtCore import QObject
+
+        self.app.processEvents()
+        return {"qobjects": len(self.window.findChildren(QObject)), "widgets": len(self.app.allWidgets())}
+
+    def start_breathing(self, mode, difficulty):
+        self.session.mode = mode
+        self.session.difficulty = difficulty
+        self.window.start_breathing_intro()
+        return self.window.breath_label.text()
+
+    def start_game(self):
+        self.window.start_button.click()
+
+    def guess(self, text):
+        self.window.guess_entry.setText(text)
+        self.window.check_guess()
+
+    def end_game(self):
+        self.window.end_button.click()
+
+    def new_session(self):
+        self.window.close_button.click()
+        self.app.processEvents()
+
+
+# === Tk ===
+
+class TkHarness:
+    def __init__(self, clock):
+        import tkinter
+
+        import app_v6
+
+        try:
+            self.root = tkinter.Tk()
+        except tkinter.TclError as exc:
+            sys.exit(f"the Tk soak needs a display: {exc}")
+        self.app = app_v6.build(self.root, clock=clock, kiosk=True)
+        self.app.sound_on.set(False)
+        self.root.update()
+        self.session = self.app.session
+        self.timers = self.app.timers
+
+    def counts(self):
+        self.root.update()
+
+        def widgets(widget):
+            return 1 + sum(widgets(child) for child in widget.winfo_children())
+
+        return {"widgets": widgets(self.root), "tcl_commands": len(self.root.tk.call("info", "commands"))}
+
+    def start_breathing(self, mode, difficulty):
+        self.app.mode.set(mode)
+        self.app.difficulty.set(difficulty)
+        self.app.start_breathing_intro()
+        self.root.update()
+        return self.app.label_start_training.cget("text")
+
+    def start_game(self):
+        self.app.btn_start.invoke()
+
+    def guess(self, text):
+        self.app.entry_guess.delete(0, "end")
+        self.app.entry_guess.insert(0, text)
+        self.app.check_guess()
+
+    def end_game(self):
+        self.app.btn_end.invoke()
+
+    def new_session(self):
+        self.app.btn_close.invoke()
+        self.root.update()
+
+
+HARNESSES = {"qt": QtHarness, "tk": TkHarness}
+
+
+def sample(harness):
+    gc.collect()
+    counts = harness.counts()
+    counts["snapshot"] = tracemalloc.take_snapshot()
+    return counts
+
+
+def run_session(harness, clock, index, rounds):
+    # Returns a list of the flow problems seen in this session
+    problems = []
+    session = harness.session
+    mode = "Think" if index % 2 else "Input"
+    difficulty = list(session.ranges)[index % len(session.ranges)]
+
+    if harness.start_breathing(mode, difficulty):
+        problems.append("start prompt shown during breathing")
+    clock.run_until_idle()  # the whole breathing pattern, then the Start button
+    harness.start_game()
+    for i in range(rounds):
+        if session.mode == "Input":
+            harness.guess(str(i + 1))
+            clock.run_until(clock.now() + 2000)
+        else:
+            clock.run_until(clock.now() + 5000)
+    harness.end_game()
+    rounds = session.rounds
+    clock.run_until(clock.now() + 5000)  # long enough for any queued round
+    if session.rounds != rounds or harness.timers.live != 1:
+        problems.append("timers left running after the end")
+    harness.new_session()
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that kiosk sessions run in bounded memory")
+    parser.add_argument("--toolkit", choices=sorted(HARNESSES), default="qt")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5, help="rounds played per session")
+    parser.add_argument("--warmup", type=int, default=200, help="sessions before the first sample")
+    parser.add_argument("--max-growth-kb", type=float, default=64.0,
+                        help="allowed Python heap growth between the samples")
+    args = parser.parse_args()
+
+    if (args.toolkit == "qt" and sys.platform == "linux"
+            and not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY")):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    import tempfile
+
+    history = tempfile.TemporaryDirectory()
+    # Keep soak rounds out of the real history
+    os.environ["INTUITION_ROUND_LOG"] = os.path.join(history.name, "rounds.bin")
+    os.environ["INTUITION_DB"] = os.path.join(history.name, "history.sqlite3")
+
+    from clock import VirtualClock
+
+    clock = VirtualClock()
+    harness = HARNESSES[args.toolkit](clock)
+
+    tracemalloc.start(10)
+    for i in range(args.warmup):
+        run_session(harness, clock, i, args.rounds)
+    before = sample(harness)
+
+    started = time.perf_counter()
+    problems = {}
+    for i in range(args.warmup, args.sessions):
+        for problem in run_session(harness, clock, i, args.rounds):
+            problems[problem] = problems.get(problem, 0) + 1
+    elapsed = time.perf_counter() - started
+    after = sample(harness)
+
+    measured = args.sessions - args.warmup
+    growth = sorted(after["snapshot"].compare_to(before["snapshot"], "traceback"),
+                    key=lambda stat: stat.size_diff, reverse=True)
+    heap_kb = sum(stat.size_diff for stat in growth) / 1024
+    counts = [name for name in before if name != "snapshot"]
+    print(f"{args.toolkit}: {measured} sessions in {elapsed:.1f} s ({measured / elapsed:.0f} sessions/s), "
+          f"{args.rounds} rounds each")
+    print(", ".join(f"{name} {before[name]} -> {after[name]}" for name in counts)
+          + f", Python heap {heap_kb:+.1f} KB")
+    print(f"timers: {harness.timers.scheduled} scheduled, {harness.timers.cancelled} cancelled on screen changes")
+
+    leaked = any(after[name] != before[name] for name in counts) or heap_kb > args.max_growth_kb
+    if leaked:
+        print("FAIL: memory grows with sessions; largest growth:")
+        for stat in growth[:5]:
+            print(f"  {stat.size_diff / 1024:+.1f} KB  {stat.traceback.format()[-1].strip()}")
+    for problem, sessions in problems.items():
+        print(f"FAIL: {problem} in {sessions} sessions")
+    return 1 if leaked or problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())